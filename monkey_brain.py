@@ -5,10 +5,14 @@ Optimized for PyCharm Structural Integrity.
 """
 import sqlite3
 import os
+import threading
 
 # Use a local path for the database to ensure write permissions in PyCharm
 DB_FILE = "monkey_core.db"
 
+# One long-lived connection per thread (see MonkeyBrain.get_cached_connection)
+_THREAD_LOCAL = threading.local()
+
 
 class MonkeyBrain:
     """The central data-limb for the Monkey OS."""
@@ -23,6 +27,32 @@ class MonkeyBrain:
         conn.row_factory = sqlite3.Row
         return conn
 
+    @staticmethod
+    def get_cached_connection():
+        """Return this thread's persistent ledger link, opened once in WAL mode."""
+        conn = getattr(_THREAD_LOCAL, "conn", None)
+        if conn is None:
+            conn = sqlite3.connect(DB_FILE, timeout=10)
+            conn.row_factory = sqlite3.Row
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            conn.execute("PRAGMA temp_store=MEMORY")
+            conn.execute("PRAGMA cache_size=-65536")  # 64 MB page cache
+            conn.execute("PRAGMA busy_timeout=5000")
+            _THREAD_LOCAL.conn = conn
+        return conn
+
+    @staticmethod
+    def journal_mode() -> str:
+        """Journal mode of this thread's cached link ('wal' once tuning took)."""
+        return MonkeyBrain.get_cached_connection().execute("PRAGMA journal_mode").fetchone()[0]
+
+    @staticmethod
+    def query_scalar(query: str, params: tuple = ()):
+        """Run an aggregate query and return its single row as a plain tuple (no DataFrame)."""
+        row = MonkeyBrain.get_cached_connection().execute(query, params).fetchone()
+        return tuple(row) if row is not None else None
+
     def _init_db(self):
         """Build the foundational tables for the Singularity."""
         conn = self._get_connection()
@@ -27,6 +27,9 @@ import json
 import os
 import time
 import uuid
+import atexit
+import threading
+from collections import deque
 from datetime import datetime
 from typing import Dict, List, Optional, Any
 
@@ -48,6 +51,19 @@ class MonkeyHeart:
     LOG_DIR = "logs"
     SESSION_ID = f"SES-{uuid.uuid4().hex[:8].upper()}"
 
+    # System events at these severities are dropped before formatting (e.g. {"DEBUG"} in production)
+    MUTED_SEVERITIES = set()
+
+    # Write-behind buffer: callers only pay for a deque append; a daemon
+    # thread drains it to disk every FLUSH_INTERVAL or at FLUSH_THRESHOLD.
+    BUFFER_SIZE = 4096
+    FLUSH_THRESHOLD = 256
+    FLUSH_INTERVAL = 0.1
+    _buffer = deque(maxlen=BUFFER_SIZE)
+    _flush_lock = threading.Lock()
+    _wake = threading.Event()
+    _flusher = None
+
     def __init__(self):
         self._setup_directories()
         self._configure_logger()
@@ -72,16 +88,23 @@ class MonkeyHeart:
     # ==========================================================================
 
     @staticmethod
-    def log_system_event(event_type: str, message: str, user: str = "SYSTEM", severity: str = "INFO"):
+    def log_system_event(event_type: str, message: str, *args, user: str = "SYSTEM", severity: str = "INFO"):
         """
         The standard log function used by all modules.
 
         ARGS:
             event_type: "VOICE", "MAPS", "AUTH", etc.
-            message: "User clicked button."
+            message: "User clicked button." or a %-template, e.g. "%s drove %d miles."
+            *args: Values for the %-template. Formatting is deferred until the
+                   event is known to be recorded (muted severities never format).
             user: Who did it?
             severity: "INFO", "WARNING", "ERROR", "CRITICAL"
         """
+        if severity in MonkeyHeart.MUTED_SEVERITIES:
+            return
+        if args:
+            message = message % args
+
         entry = {
             "timestamp": datetime.now().isoformat(),
             "session": MonkeyHeart.SESSION_ID,
@@ -94,10 +117,14 @@ class MonkeyHeart:
         MonkeyHeart._write_entry(entry)
 
     @staticmethod
-    def log_financial_event(job_id: str, amount: float, description: str, user: str):
+    def log_financial_event(job_id: str, amount: float, description: str, user: str, *args):
         """
         High-priority logging for money.
+        `description` may be a constant %-template filled from *args (no f-string per call).
         """
+        if args:
+            description = description % args
+
         entry = {
             "timestamp": datetime.now().isoformat(),
             "session": MonkeyHeart.SESSION_ID,
@@ -110,7 +137,7 @@ class MonkeyHeart:
         }
         MonkeyHeart._write_entry(entry)
         # In V7.0, we also print Money logs to console for visibility
-        print(f"💰 [AUDIT] {job_id}: ${amount} - {description}")
+        print("💰 [AUDIT] %s: $%s - %s" % (job_id, amount, description))
 
     @staticmethod
     def log_security_event(event_type: str, details: str, status: str):
@@ -145,23 +172,68 @@ class MonkeyHeart:
         elif entry.get("category") == "SECURITY":
             icon = "🔒"
 
-        log_msg = f"{icon} [{entry['type']}] {entry['message']}"
+        # Financial entries carry no 'type'; label them by category
+        log_msg = f"{icon} [{entry.get('type', entry['category'])}] {entry['message']}"
         print(log_msg)
 
         # 2. File Output (The Persistent Record)
-        # In V7.0, check directory existence again just in case
-        if not os.path.exists(cls.LOG_DIR):
-            os.makedirs(cls.LOG_DIR)
+        # Queued for the background flusher; the file write happens off the caller's path.
+        cls._start_flusher()
+        cls._buffer.append(entry)
+        pending = len(cls._buffer)
+        if pending >= cls.BUFFER_SIZE:
+            # Full buffer: flush inline rather than let the deque drop audit entries
+            cls.flush()
+        elif pending >= cls.FLUSH_THRESHOLD:
+            cls._wake.set()
 
-        today = datetime.now().strftime("%Y-%m-%d")
-        path = os.path.join(cls.LOG_DIR, f"monkeys_{today}.jsonl")
+    @classmethod
+    def _start_flusher(cls):
+        """Lazily starts the daemon thread that drains the buffer to disk."""
+        if cls._flusher is not None:
+            return
+        with cls._flush_lock:
+            if cls._flusher is None:
+                cls._flusher = threading.Thread(target=cls._flush_loop, name="MonkeyHeartFlusher", daemon=True)
+                cls._flusher.start()
+                atexit.register(cls.flush)
 
-        try:
-            with open(path, "a", encoding="utf-8") as f:
-                f.write(json.dumps(entry) + "\n")
-        except Exception as e:
-            # If logging fails, we are in deep trouble. Print to stderr.
-            print(f"!!! CRITICAL FAILURE: CANNOT WRITE LOGS: {e}")
+    @classmethod
+    def _flush_loop(cls):
+        while True:
+            cls._wake.wait(cls.FLUSH_INTERVAL)
+            cls._wake.clear()
+            cls.flush()
+
+    @classmethod
+    def flush(cls):
+        """
+        Writes every buffered entry to its daily .jsonl file.
+        Call from shutdown hooks and tests that read the log back.
+        """
+        with cls._flush_lock:
+            if not cls._buffer:
+                return
+
+            # Group by day so an entry queued before midnight lands in that day's file
+            by_day = {}
+            buf = cls._buffer
+            while buf:
+                entry = buf.popleft()
+                by_day.setdefault(entry["timestamp"][:10], []).append(json.dumps(entry))
+
+            try:
+                # In V7.0, check directory existence again just in case
+                if not os.path.exists(cls.LOG_DIR):
+                    os.makedirs(cls.LOG_DIR)
+
+                for day, lines in by_day.items():
+                    path = os.path.join(cls.LOG_DIR, f"monkeys_{day}.jsonl")
+                    with open(path, "a", encoding="utf-8") as f:
+                        f.write("\n".join(lines) + "\n")
+            except Exception as e:
+                # If logging fails, we are in deep trouble. Print to stderr.
+                print(f"!!! CRITICAL FAILURE: CANNOT WRITE LOGS: {e}")
 
     # ==========================================================================
     # 💓 THE PULSE (Uptime Check)
@@ -197,6 +269,7 @@ if __name__ == "__main__":
 
     # 5. Verify File
     print("\n[TEST 4] Verifying Log File...")
+    MonkeyHeart.flush()
     today = datetime.now().strftime("%Y-%m-%d")
     path = os.path.join("logs", f"monkeys_{today}.jsonl")
     if os.path.exists(path):
@@ -24,7 +24,9 @@ INTEGRATIONS:
 import sys
 import time
 import importlib
+import importlib.util
 from datetime import datetime
+from typing import Tuple
 
 # ==============================================================================
 # 📋 THE V7.0 MANIFEST
@@ -65,6 +67,11 @@ MODULES_TO_CHECK = [
     ("rabbit_closeout", "Project Closeout")
 ]
 
+# Memoized finder results (module name -> ModuleSpec or None).
+# Repeat diagnostics in a long-running process skip the path-finder walk.
+_SPEC_CACHE = {}
+_SENTINEL = object()
+
 
 # ==============================================================================
 # 🩺 DIAGNOSTIC ENGINE
@@ -75,6 +82,14 @@ class PulseCheck:
         self.results = []
         self.start_time = time.time()
 
+    @staticmethod
+    def invalidate():
+        """
+        Forget memoized module specs (e.g. after new organs are installed).
+        """
+        _SPEC_CACHE.clear()
+        importlib.invalidate_caches()
+
     def run_diagnostics(self):
         print("\n" + "=" * 60)
         print(f"🩺 JUST-IN-SITE V7.0 SYSTEM DIAGNOSTIC")
@@ -82,41 +97,52 @@ class PulseCheck:
         print("=" * 60 + "\n")
 
         success_count = 0
+        rows = []
 
         for module_name, friendly_name in MODULES_TO_CHECK:
-            status = self._test_organ(module_name, friendly_name)
+            status, row = self._test_organ(module_name, friendly_name)
+            rows.append(row)
             if status:
                 success_count += 1
 
+        # One write for the whole board instead of one per organ
+        sys.stdout.write("\n".join(rows) + "\n")
+
         self._print_summary(success_count)
 
-    def _test_organ(self, module_name: str, friendly_name: str) -> bool:
+    def _test_organ(self, module_name: str, friendly_name: str) -> Tuple[bool, str]:
         """
         Attempts to import and init the module.
+        Returns (success, formatted board row).
         """
         try:
-            # 1. Import Time
+            # 1. Locate (memoized across runs)
+            spec = _SPEC_CACHE.get(module_name, _SENTINEL)
+            if spec is _SENTINEL:
+                spec = importlib.util.find_spec(module_name)
+                _SPEC_CACHE[module_name] = spec
+            if spec is None:
+                raise ImportError(module_name)
+
+            # 2. Import Time
             t0 = time.time()
             mod = importlib.import_module(module_name)
             t1 = time.time()
             import_ms = (t1 - t0) * 1000
 
-            # 2. Check for Class (Naive check for PascalCase matching filename)
+            # 3. Check for Class (Naive check for PascalCase matching filename)
             # e.g., raptor_pricing -> RaptorPricing
             class_name = "".join(x.title() for x in module_name.split('_'))
 
             has_class = hasattr(mod, class_name)
             status_icon = "✅" if has_class else "⚠️"
 
-            print(f"{status_icon} {module_name:<20} | {friendly_name:<20} | {import_ms:.2f}ms")
-            return True
+            return True, f"{status_icon} {module_name:<20} | {friendly_name:<20} | {import_ms:.2f}ms"
 
         except ImportError:
-            print(f"❌ {module_name:<20} | {friendly_name:<20} | MODULE MISSING")
-            return False
+            return False, f"❌ {module_name:<20} | {friendly_name:<20} | MODULE MISSING"
         except Exception as e:
-            print(f"🔥 {module_name:<20} | {friendly_name:<20} | CRASH: {str(e)}")
-            return False
+            return False, f"🔥 {module_name:<20} | {friendly_name:<20} | CRASH: {str(e)}"
 
     def _print_summary(self, success_count: int):
         total = len(MODULES_TO_CHECK)
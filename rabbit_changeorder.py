@@ -23,9 +23,12 @@ INTEGRATIONS:
 """
 
 import time
+from dataclasses import dataclass, replace
 from datetime import datetime
 from typing import List, Dict, Optional, Any
 
+from rabbit_ids import strip_job_prefix
+
 # ==============================================================================
 # 🍌 IMPORT BANANAS (The Shield)
 # ==============================================================================
@@ -60,16 +63,34 @@ except ImportError:
 # 📝 THE CHANGE LOG (Mock Database)
 # ==============================================================================
 
-MOCK_COPS = [
-    {
-        "id": "COP-26001-001",
-        "job_id": "JOB-26001",
-        "title": "Added Outlets in Lobby",
-        "rfi_link": "N/A",
-        "status": "APPROVED",
-        "total": 1250.00
-    }
-]
+@dataclass(slots=True)
+class COP:
+    """
+    One Change Order Proposal. Slotted to keep large change logs compact.
+    """
+    id: str
+    job_id: str
+    title: str
+    rfi_link: str
+    status: str
+    total: float
+    breakdown: Optional[Dict[str, float]] = None
+    created_at: Optional[str] = None
+    approved_by: Optional[str] = None
+    approved_date: Optional[str] = None
+
+
+# Frozen seed data. Each RabbitChangeOrder gets its own copy of the records.
+MOCK_COPS = (
+    COP(
+        id="COP-26001-001",
+        job_id="JOB-26001",
+        title="Added Outlets in Lobby",
+        rfi_link="N/A",
+        status="APPROVED",
+        total=1250.00
+    ),
+)
 
 
 # ==============================================================================
@@ -82,7 +103,8 @@ class RabbitChangeOrder:
     """
 
     def __init__(self):
-        self.cops = MOCK_COPS
+        self.cops = [replace(c) for c in MOCK_COPS]
+        self._by_id = {c.id: c for c in self.cops}
         self.rates = {
             "labor_hr": 85.00,
             "overhead_pct": 0.10,  # 10%
@@ -107,25 +129,26 @@ class RabbitChangeOrder:
         profit = (subtotal + overhead) * self.rates['profit_pct']
         grand_total = subtotal + overhead + profit
 
-        cop_id = f"COP-{job_id.replace('JOB-', '')}-{len(self.cops) + 1:03d}"
+        cop_id = f"COP-{strip_job_prefix(job_id)}-{len(self.cops) + 1:03d}"
 
-        new_cop = {
-            "id": cop_id,
-            "job_id": job_id,
-            "title": title,
-            "rfi_link": rfi_id if rfi_id else "N/A",
-            "breakdown": {
+        new_cop = COP(
+            id=cop_id,
+            job_id=job_id,
+            title=title,
+            rfi_link=rfi_id if rfi_id else "N/A",
+            breakdown={
                 "labor": labor_total,
                 "material": material_cost,
                 "overhead": overhead,
                 "profit": profit
             },
-            "total": round(grand_total, 2),
-            "status": "DRAFT",
-            "created_at": datetime.now().isoformat()
-        }
+            total=round(grand_total, 2),
+            status="DRAFT",
+            created_at=datetime.now().isoformat()
+        )
 
         self.cops.append(new_cop)
+        self._by_id[cop_id] = new_cop
 
         MonkeyHeart.log_system_event("COP_CREATE", f"Drafted {cop_id}: ${grand_total:.2f}")
 
@@ -139,16 +162,16 @@ class RabbitChangeOrder:
         """
         Client signed the paper. We can now bill for it.
         """
-        cop = next((c for c in self.cops if c['id'] == cop_id), None)
+        cop = self._by_id.get(cop_id)
         if not cop: return False
 
-        cop['status'] = "APPROVED"
-        cop['approved_by'] = approved_by
-        cop['approved_date'] = datetime.now().isoformat()
+        cop.status = "APPROVED"
+        cop.approved_by = approved_by
+        cop.approved_date = datetime.now().isoformat()
 
         # Log Revenue Event
-        MonkeyHeart.log_financial_event(cop['job_id'], cop['total'], f"Change Order {cop_id} APPROVED", approved_by)
-        Bananas.notify("New Revenue", f"COP {cop_id} Approved! Value: ${cop['total']}")
+        MonkeyHeart.log_financial_event(cop.job_id, cop.total, f"Change Order {cop_id} APPROVED", approved_by)
+        Bananas.notify("New Revenue", f"COP {cop_id} Approved! Value: ${cop.total}")
 
         return True
 
@@ -160,9 +183,9 @@ class RabbitChangeOrder:
         """
         Connects the question (RFI) to the cost (COP).
         """
-        cop = next((c for c in self.cops if c['id'] == cop_id), None)
+        cop = self._by_id.get(cop_id)
         if cop:
-            cop['rfi_link'] = rfi_id
+            cop.rfi_link = rfi_id
             MonkeyHeart.log_system_event("COP_LINK", f"Linked {cop_id} to {rfi_id}")
 
 
@@ -188,7 +211,7 @@ if __name__ == "__main__":
 
     # 4. Verify Status
     cop = negotiator.cops[-1]
-    print(f" > Final Status: {cop['status']}")
+    print(f" > Final Status: {cop.status}")
 
     print("\n" + "=" * 40)
     print("🐰 RABBIT CHANGE ORDER SYSTEM: OPERATIONAL")
\ No newline at end of file
@@ -23,6 +23,7 @@ INTEGRATIONS:
 """
 
 import time
+from dataclasses import dataclass
 from datetime import datetime, timedelta
 from typing import List, Dict, Optional, Any
 
@@ -56,34 +57,48 @@ except ImportError:
 # 🔨 THE TOOL CRIB (Mock Database)
 # ==============================================================================
 
+@dataclass(slots=True)
+class Tool:
+    """
+    One asset in the crib. Slotted to keep large cribs compact.
+    """
+    name: str
+    category: str
+    status: str  # IN_CRIB, ASSIGNED, BROKEN, LOST
+    assigned_to: Optional[str]
+    job_location: str
+    calibration_due: Optional[str]
+    condition: str
+
+
 MOCK_TOOLS = {
-    "TOOL-101": {
-        "name": "Hilti TE-60 Hammer Drill",
-        "category": "POWER_TOOL",
-        "status": "IN_CRIB",  # IN_CRIB, ASSIGNED, BROKEN, LOST
-        "assigned_to": None,
-        "job_location": "WAREHOUSE",
-        "calibration_due": None,
-        "condition": "GOOD"
-    },
-    "TOOL-205": {
-        "name": "Greenlee 555 Bender",
-        "category": "HEAVY_EQUIP",
-        "status": "ASSIGNED",
-        "assigned_to": "Foreman Mike",
-        "job_location": "JOB-26001",
-        "calibration_due": None,
-        "condition": "FAIR"
-    },
-    "TOOL-300": {
-        "name": "Torque Wrench 1/2in",
-        "category": "PRECISION",
-        "status": "IN_CRIB",
-        "assigned_to": None,
-        "job_location": "WAREHOUSE",
-        "calibration_due": "2025-01-01",  # EXPIRED!
-        "condition": "GOOD"
-    }
+    "TOOL-101": Tool(
+        name="Hilti TE-60 Hammer Drill",
+        category="POWER_TOOL",
+        status="IN_CRIB",
+        assigned_to=None,
+        job_location="WAREHOUSE",
+        calibration_due=None,
+        condition="GOOD"
+    ),
+    "TOOL-205": Tool(
+        name="Greenlee 555 Bender",
+        category="HEAVY_EQUIP",
+        status="ASSIGNED",
+        assigned_to="Foreman Mike",
+        job_location="JOB-26001",
+        calibration_due=None,
+        condition="FAIR"
+    ),
+    "TOOL-300": Tool(
+        name="Torque Wrench 1/2in",
+        category="PRECISION",
+        status="IN_CRIB",
+        assigned_to=None,
+        job_location="WAREHOUSE",
+        calibration_due="2025-01-01",  # EXPIRED!
+        condition="GOOD"
+    )
 }
 
 
@@ -98,6 +113,11 @@ class RabbitClaws:
 
     def __init__(self):
         self.crib = MOCK_TOOLS
+        # Pre-parsed calibration dates (only tools that actually carry one)
+        self._cal_due = {
+            tid: datetime.fromisoformat(tool.calibration_due)
+            for tid, tool in self.crib.items() if tool.calibration_due
+        }
 
     # ==========================================================================
     # 📝 ASSIGNMENT (The Library)
@@ -112,22 +132,22 @@ class RabbitClaws:
             return {"success": False, "reason": "Tool Not Found"}
 
         # 1. Availability Check
-        if tool['status'] != "IN_CRIB":
-            return {"success": False, "reason": f"Tool is {tool['status']} (at {tool['job_location']})"}
+        if tool.status != "IN_CRIB":
+            return {"success": False, "reason": f"Tool is {tool.status} (at {tool.job_location})"}
 
         # 2. Calibration Watchdog
-        if tool['calibration_due']:
-            due_date = datetime.strptime(tool['calibration_due'], "%Y-%m-%d")
+        due_date = self._cal_due.get(tool_id)
+        if due_date:
             if datetime.now() > due_date:
-                Bananas.notify("Safety Lock", f"{tool['name']} Calibration Expired on {tool['calibration_due']}.")
+                Bananas.notify("Safety Lock", f"{tool.name} Calibration Expired on {tool.calibration_due}.")
                 return {"success": False, "reason": "CALIBRATION_EXPIRED"}
 
         # 3. Assign
-        tool['status'] = "ASSIGNED"
-        tool['assigned_to'] = user_id
-        tool['job_location'] = job_id
+        tool.status = "ASSIGNED"
+        tool.assigned_to = user_id
+        tool.job_location = job_id
 
-        MonkeyHeart.log_system_event("TOOL_OUT", f"{tool['name']} assigned to {user_id} @ {job_id}")
+        MonkeyHeart.log_system_event("TOOL_OUT", f"{tool.name} assigned to {user_id} @ {job_id}")
         return {"success": True, "message": "Tool Checked Out."}
 
     def return_tool(self, tool_id: str, condition: str, notes: str = "") -> Dict[str, Any]:
@@ -137,13 +157,13 @@ class RabbitClaws:
         tool = self.crib.get(tool_id)
         if not tool: return {"success": False}
 
-        prev_user = tool['assigned_to']
-        tool['status'] = "IN_CRIB"
-        tool['assigned_to'] = None
-        tool['job_location'] = "WAREHOUSE"
-        tool['condition'] = condition
+        prev_user = tool.assigned_to
+        tool.status = "IN_CRIB"
+        tool.assigned_to = None
+        tool.job_location = "WAREHOUSE"
+        tool.condition = condition
 
-        MonkeyHeart.log_system_event("TOOL_IN", f"{tool['name']} returned by {prev_user}. Condition: {condition}")
+        MonkeyHeart.log_system_event("TOOL_IN", f"{tool.name} returned by {prev_user}. Condition: {condition}")
 
         if condition == "BROKEN":
             self._flag_for_repair(tool_id, notes)
@@ -159,8 +179,8 @@ class RabbitClaws:
         Internal method to lock a broken tool.
         """
         tool = self.crib[tool_id]
-        tool['status'] = "BROKEN"
-        msg = f"REPAIR TICKET: {tool['name']} - {issue}"
+        tool.status = "BROKEN"
+        msg = f"REPAIR TICKET: {tool.name} - {issue}"
         Bananas.notify("Tool Damaged", msg)
         MonkeyHeart.log_system_event("TOOL_BROKEN", msg)
 
@@ -172,13 +192,15 @@ class RabbitClaws:
         now = datetime.now()
         warning_window = timedelta(days=30)
 
-        for tid, data in self.crib.items():
-            if data['calibration_due']:
-                due = datetime.strptime(data['calibration_due'], "%Y-%m-%d")
-                if now > due:
-                    alerts.append(f"OVERDUE: {data['name']} (Exp: {data['calibration_due']})")
-                elif now + warning_window > due:
-                    alerts.append(f"DUE SOON: {data['name']} (Exp: {data['calibration_due']})")
+        soon = now + warning_window
+
+        for tid, due in self._cal_due.items():
+            if now > due:
+                tool = self.crib[tid]
+                alerts.append(f"OVERDUE: {tool.name} (Exp: {tool.calibration_due})")
+            elif soon > due:
+                tool = self.crib[tid]
+                alerts.append(f"DUE SOON: {tool.name} (Exp: {tool.calibration_due})")
 
         return alerts
 
@@ -209,7 +231,7 @@ if __name__ == "__main__":
 
     # 5. Verify Lock
     tool = crib_manager.crib["TOOL-101"]
-    print(f" > Drill Status: {tool['status']}")  # Should be BROKEN
+    print(f" > Drill Status: {tool.status}")  # Should be BROKEN
 
     print("\n" + "=" * 40)
     print("🐰 RABBIT CLAWS SYSTEM: OPERATIONAL")
\ No newline at end of file
@@ -23,9 +23,12 @@ INTEGRATIONS:
 """
 
 import time
+from dataclasses import dataclass, replace
 from datetime import datetime, timedelta
 from typing import List, Dict, Optional, Any
 
+from rabbit_ids import strip_job_prefix
+
 # ==============================================================================
 # 🍌 IMPORT BANANAS (The Shield)
 # ==============================================================================
@@ -56,16 +59,32 @@ except ImportError:
 # 🥊 THE PUNCH LIST (Mock Database)
 # ==============================================================================
 
-MOCK_PUNCH = [
-    {
-        "id": "PL-26001-001",
-        "job_id": "JOB-26001",
-        "item": "Missing cover plate in Room 102",
-        "assigned_to": "Billy",
-        "status": "OPEN",  # OPEN, COMPLETED, VERIFIED
-        "due_date": "2026-02-01"
-    }
-]
+@dataclass(slots=True)
+class PunchItem:
+    """
+    One deficiency on the punch list. Slotted to keep large walk-throughs compact.
+    """
+    id: str
+    job_id: str
+    item: str
+    assigned_to: str
+    status: str  # OPEN, COMPLETED, VERIFIED
+    due_date: str
+    completed_by: Optional[str] = None
+    completed_at: Optional[str] = None
+
+
+# Frozen seed data. Each RabbitCloseout gets its own copy of the records.
+MOCK_PUNCH = (
+    PunchItem(
+        id="PL-26001-001",
+        job_id="JOB-26001",
+        item="Missing cover plate in Room 102",
+        assigned_to="Billy",
+        status="OPEN",
+        due_date="2026-02-01"
+    ),
+)
 
 
 # ==============================================================================
@@ -78,7 +97,8 @@ class RabbitCloseout:
     """
 
     def __init__(self):
-        self.punch_list = MOCK_PUNCH
+        self.punch_list = [replace(p) for p in MOCK_PUNCH]
+        self._by_id = {p.id: p for p in self.punch_list}
         self.warranties = []
 
     # ==========================================================================
@@ -89,19 +109,20 @@ class RabbitCloseout:
         """
         Logs a deficiency found during the walk-through.
         """
-        pl_id = f"PL-{job_id.replace('JOB-', '')}-{len(self.punch_list) + 1:03d}"
+        pl_id = f"PL-{strip_job_prefix(job_id)}-{len(self.punch_list) + 1:03d}"
         due_dt = (datetime.now() + timedelta(days=7)).strftime("%Y-%m-%d")
 
-        item = {
-            "id": pl_id,
-            "job_id": job_id,
-            "item": description,
-            "assigned_to": assigned_to,
-            "status": "OPEN",
-            "due_date": due_dt
-        }
+        item = PunchItem(
+            id=pl_id,
+            job_id=job_id,
+            item=description,
+            assigned_to=assigned_to,
+            status="OPEN",
+            due_date=due_dt
+        )
 
         self.punch_list.append(item)
+        self._by_id[pl_id] = item
 
         MonkeyHeart.log_system_event("PUNCH_ADD", f"Item added to {job_id}: {description}")
         Bananas.notify("Punch List", f"New Item for {assigned_to}: {description}")
@@ -112,12 +133,12 @@ class RabbitCloseout:
         """
         Tech marks it done.
         """
-        item = next((p for p in self.punch_list if p['id'] == pl_id), None)
+        item = self._by_id.get(pl_id)
         if not item: return False
 
-        item['status'] = "COMPLETED"
-        item['completed_by'] = tech_user
-        item['completed_at'] = datetime.now().isoformat()
+        item.status = "COMPLETED"
+        item.completed_by = tech_user
+        item.completed_at = datetime.now().isoformat()
 
         MonkeyHeart.log_system_event("PUNCH_FIX", f"{pl_id} fixed by {tech_user}. Ready for Verification.")
         return True
@@ -131,7 +152,7 @@ class RabbitCloseout:
         Generates the 1-Year Warranty Certificate.
         """
         # 1. Check for Open Punch Items
-        open_items = [p for p in self.punch_list if p['job_id'] == job_id and p['status'] != "VERIFIED"]
+        open_items = [p for p in self.punch_list if p.job_id == job_id and p.status != "VERIFIED"]
         if open_items:
             Bananas.notify("Cannot Issue Warranty", f"{len(open_items)} Punch Items are still open!")
             return {"success": False, "reason": "OPEN_PUNCH_LIST"}
@@ -139,7 +160,7 @@ class RabbitCloseout:
         start_dt = datetime.strptime(substantial_completion_date, "%Y-%m-%d")
         end_dt = start_dt + timedelta(days=365)
 
-        warranty_id = f"WAR-{job_id.replace('JOB-', '')}"
+        warranty_id = f"WAR-{strip_job_prefix(job_id)}"
 
         record = {
             "id": warranty_id,
@@ -173,7 +194,7 @@ class RabbitCloseout:
             "as_builts": True,
             "om_manuals": True,
             "warranty_cert": any(w['job_id'] == job_id for w in self.warranties),
-            "punch_list_clear": not any(p['job_id'] == job_id and p['status'] != "VERIFIED" for p in self.punch_list)
+            "punch_list_clear": not any(p.job_id == job_id and p.status != "VERIFIED" for p in self.punch_list)
         }
 
 
@@ -200,12 +221,12 @@ if __name__ == "__main__":
     print("\n[TEST 3] Billy fixes the scratch...")
     finisher.close_punch_item(res1['id'], "Billy")
     # Mark Verified manually for test
-    finisher.punch_list[-1]['status'] = "VERIFIED"
+    finisher.punch_list[-1].status = "VERIFIED"
 
     # 5. Issue Warranty (Success)
     print("\n[TEST 4] Issuing Warranty...")
     # Clean up mock data first to ensure clean state
-    finisher.punch_list = [p for p in finisher.punch_list if p['status'] == "VERIFIED"]
+    finisher.punch_list = [p for p in finisher.punch_list if p.status == "VERIFIED"]
 
     res3 = finisher.issue_warranty("JOB-26001", "2026-02-01")
     print(f" > {res3.get('message')}")
@@ -21,10 +21,19 @@ INTEGRATIONS:
 - Monkey Heart (Logging)
 """
 
-import uuid
 import time
-from datetime import datetime, timedelta
-from typing import List, Dict, Optional, Any
+import itertools
+from bisect import bisect_right
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, date
+from typing import List, Dict, Optional, Any, NamedTuple
+
+# NumPy is optional: large cert tables get a vectorized sweep when it is present
+try:
+    import numpy as np
+except ImportError:
+    np = None
 
 # ==============================================================================
 # 🍌 IMPORT BANANAS (The Shield)
@@ -56,6 +65,10 @@ except ImportError:
 # 🪪 CERTIFICATION DB (Mock Data)
 # ==============================================================================
 
+STATUS_EXPIRED = "EXPIRED"
+ISSUE_EXPIRED = STATUS_EXPIRED
+ISSUE_EXPIRING = "EXPIRING"
+
 MOCK_CERTS = [
     {
         "user_id": "U-005", "name": "Foreman Mike",
@@ -71,6 +84,49 @@ MOCK_CERTS = [
     }
 ]
 
+class CertIssue(NamedTuple):
+    """
+    One eligibility finding. Stored raw; the banner text is only built on str().
+    """
+    kind: str  # ISSUE_EXPIRED or ISSUE_EXPIRING
+    name: str
+    cert_type: str
+    expires: str
+
+    def __str__(self):
+        if self.kind == ISSUE_EXPIRED:
+            return f"⛔ {self.name}: {self.cert_type} EXPIRED on {self.expires}"
+        return f"⚠️ {self.name}: {self.cert_type} expires soon ({self.expires})"
+
+
+# Toolbox Talk IDs: clock-seeded counter, no entropy-pool call per talk
+_TT_COUNTER = itertools.count(int(time.time()))
+
+# Incident IDs: same clock-seeded counter, so an ID never repeats and overwrites an earlier report
+_INC_COUNTER = itertools.count(int(time.time()))
+
+# Incident paperwork (legal PDF + email) runs off the caller's thread.
+# Toasts stay on the caller's thread (Streamlit only renders from the script thread).
+_INCIDENT_POOL = ThreadPoolExecutor(max_workers=4, thread_name_prefix="incident")
+
+
+def _file_incident_paperwork(report_id: str, job_id: str, type: str, description: str):
+    """
+    Background job: generate the legal PDF and fire the Safety Director email.
+    """
+    # Simulate generating the legal PDF
+    MonkeyHeart.log_system_event("INCIDENT_PDF", f"Report {report_id} generated.")
+
+    # In V7.0, we simulate the email trigger
+    print(f" >> [EMAIL ALERT] To: safety@justinsite.com | Subj: URGENT {type} on {job_id}")
+
+
+def _report_paperwork_failure(report_id: str, future):
+    """Done-callback: failed paperwork is logged right away, not only when someone polls."""
+    error = future.exception()
+    if error is not None:
+        MonkeyHeart.log_system_event("INCIDENT_PAPERWORK_FAILED", f"{report_id}: {error!r}")
+
 
 # ==============================================================================
 # 🐰 RABBIT COMPLIANCE CLASS
@@ -82,7 +138,41 @@ class RabbitCompliance:
     """
 
     def __init__(self):
-        self.certs = MOCK_CERTS
+        self.incidents = {}  # report_id -> {"job_id", "type", "future"}
+
+        # Cert table stored column-wise (SoA). Expiry is pre-parsed to day
+        # ordinals so sweeps are pure int compares. Row dicts: see `certs`.
+        self._uids = [c['user_id'] for c in MOCK_CERTS]
+        self._names = [c['name'] for c in MOCK_CERTS]
+        self._ctypes = [c['cert_type'] for c in MOCK_CERTS]
+        self._exp_str = [c['expires'] for c in MOCK_CERTS]
+        self._exp_ord = [date.fromisoformat(s).toordinal() for s in self._exp_str]
+        self._statuses = [c['status'] for c in MOCK_CERTS]
+
+        # user_id -> row positions
+        self._rows_by_user = defaultdict(list)
+        for i, uid in enumerate(self._uids):
+            self._rows_by_user[uid].append(i)
+
+        if np is not None:
+            self._np_uids = np.array(self._uids)
+            self._np_exp_ord = np.array(self._exp_ord, dtype=np.int64)
+
+        # (expiry ordinal, row) in ascending order. A sorted list is already a
+        # valid min-heap, and it also lets expiring_within() bisect straight
+        # to the window and stop at the horizon.
+        self._exp_heap = sorted((exp_ord, i) for i, exp_ord in enumerate(self._exp_ord))
+
+    @property
+    def certs(self) -> List[Dict[str, str]]:
+        """
+        Row-shaped (AoS) view of the cert table for outside callers.
+        """
+        return [
+            {"user_id": uid, "name": name, "cert_type": ctype, "expires": exp, "status": status}
+            for uid, name, ctype, exp, status
+            in zip(self._uids, self._names, self._ctypes, self._exp_str, self._statuses)
+        ]
 
     # ==========================================================================
     # 📜 CERTIFICATION TRACKING
@@ -91,22 +181,37 @@ class RabbitCompliance:
     def check_crew_eligibility(self, crew_ids: List[str]) -> Dict[str, Any]:
         """
         Scans a list of users to see if anyone is illegal to work.
+        Issues are CertIssue tuples; str(issue) gives the display line.
         """
         issues = []
-        today = datetime.now()
-
-        for cert in self.certs:
-            if cert['user_id'] in crew_ids:
-                exp_date = datetime.strptime(cert['expires'], "%Y-%m-%d")
-
-                # Check Expiration
-                if today > exp_date:
-                    issues.append(f"⛔ {cert['name']}: {cert['cert_type']} EXPIRED on {cert['expires']}")
-                    MonkeyHeart.log_system_event("COMPLIANCE_FAIL", f"Found expired cert for {cert['name']}")
-
-                # Check "About to Expire" (30 days)
-                elif today + timedelta(days=30) > exp_date:
-                    issues.append(f"⚠️ {cert['name']}: {cert['cert_type']} expires soon ({cert['expires']})")
+        today_ord = date.today().toordinal()
+        soon_ord = today_ord + 30
+
+        names, ctypes, exp_strs, exp_ords = self._names, self._ctypes, self._exp_str, self._exp_ord
+
+        if np is not None:
+            # Vectorized sweep: masks over the whole table, format only the hits
+            np_exp = self._np_exp_ord
+            crew_m = np.isin(self._np_uids, np.asarray(list(crew_ids), dtype=str))
+            expired_m = crew_m & (np_exp <= today_ord)
+            soon_m = crew_m & (np_exp > today_ord) & (np_exp <= soon_ord)
+            rows = np.flatnonzero(expired_m | soon_m).tolist()
+        else:
+            # Only walk the requested crew's rows (dict.fromkeys drops duplicate IDs)
+            by_user = self._rows_by_user
+            rows = [i for uid in dict.fromkeys(crew_ids) for i in by_user.get(uid, ())]
+
+        for i in rows:
+            exp_ord = exp_ords[i]
+
+            # Check Expiration (a cert is dead on its expiry day)
+            if exp_ord <= today_ord:
+                issues.append(CertIssue(ISSUE_EXPIRED, names[i], ctypes[i], exp_strs[i]))
+                MonkeyHeart.log_system_event("COMPLIANCE_FAIL", f"Found expired cert for {names[i]}")
+
+            # Check "About to Expire" (30 days)
+            elif exp_ord <= soon_ord:
+                issues.append(CertIssue(ISSUE_EXPIRING, names[i], ctypes[i], exp_strs[i]))
 
         if issues:
             Bananas.notify("Compliance Alert", f"Found {len(issues)} certification issues.")
@@ -114,6 +219,19 @@ class RabbitCompliance:
 
         return {"safe": True, "issues": []}
 
+    def expiring_within(self, days: int = 30) -> List[CertIssue]:
+        """
+        Company-wide: every still-valid cert that lapses in the next `days` days,
+        soonest first. Touches only the certs inside the window.
+        """
+        today_ord = date.today().toordinal()
+        heap = self._exp_heap
+        start = bisect_right(heap, (today_ord, float('inf')))
+        end = bisect_right(heap, (today_ord + days, float('inf')), lo=start)
+
+        return [CertIssue(ISSUE_EXPIRING, self._names[i], self._ctypes[i], self._exp_str[i])
+                for _, i in heap[start:end]]
+
     # ==========================================================================
     # 🗣️ TOOLBOX TALKS (Digital Sign-In)
     # ==========================================================================
@@ -128,7 +246,7 @@ class RabbitCompliance:
 
         # In a real app, we'd save a PDF signature sheet here.
         log_entry = {
-            "id": f"TT-{uuid.uuid4().hex[:6]}",
+            "id": f"TT-{next(_TT_COUNTER):06x}",
             "job_id": job_id,
             "date": datetime.now().isoformat(),
             "topic": topic,
@@ -147,30 +265,40 @@ class RabbitCompliance:
     def report_incident(self, job_id: str, type: str, description: str, witnesses: str) -> str:
         """
         Logs a Near Miss or Injury.
-        Auto-Emails the Safety Director (simulated).
+        Auto-Emails the Safety Director (simulated) in the background;
+        poll get_status(report_id) for the paperwork.
 
         ARGS:
             type: "NEAR_MISS", "INJURY", "PROPERTY_DAMAGE"
         """
-        report_id = f"INC-{datetime.now().strftime('%Y%m%d')}-{random.randint(100, 999)}"
+        report_id = f"INC-{datetime.now().strftime('%Y%m%d')}-{next(_INC_COUNTER)}"
 
         MonkeyHeart.log_system_event("INCIDENT", f"New {type} reported on {job_id}: {report_id}")
-
-        # Simulate generating the legal PDF
         Bananas.notify("Incident Recorded", f"Report {report_id} generated. Notify HR immediately.")
 
-        # In V7.0, we simulate the email trigger
-        print(f" >> [EMAIL ALERT] To: safety@justinsite.com | Subj: URGENT {type} on {job_id}")
+        # Slow I/O goes to the pool; the incident is on record for polling immediately
+        future = _INCIDENT_POOL.submit(_file_incident_paperwork, report_id, job_id, type, description)
+        future.add_done_callback(lambda f: _report_paperwork_failure(report_id, f))
+        self.incidents[report_id] = {"job_id": job_id, "type": type, "future": future}
 
         return report_id
 
+    def get_status(self, report_id: str) -> str:
+        """
+        Paperwork status for an incident: PENDING, FILED, FAILED or UNKNOWN.
+        """
+        record = self.incidents.get(report_id)
+        if not record: return "UNKNOWN"
+
+        future = record["future"]
+        if not future.done(): return "PENDING"
+        return "FAILED" if future.exception() else "FILED"
+
 
 # ==============================================================================
 # 🧪 SELF-DIAGNOSTIC (The Friday Test)
 # ==============================================================================
 if __name__ == "__main__":
-    import random  # imported here for the mock function above to work in standalone
-
     print("\n🐰 RABBIT COMPLIANCE V7.0 DIAGNOSTIC\n" + "=" * 40)
 
     # 1. Initialize
@@ -192,6 +320,8 @@ if __name__ == "__main__":
     print("\n[TEST 3] Reporting Near Miss...")
     rpt_id = marshal.report_incident("JOB-26001", "NEAR_MISS", "Hammer dropped from 6ft ladder", "Joe")
     print(f" > Report ID Generated: {rpt_id}")
+    marshal.incidents[rpt_id]["future"].result()
+    print(f" > Paperwork: {marshal.get_status(rpt_id)}")
 
     print("\n" + "=" * 40)
     print("🐰 RABBIT COMPLIANCE SYSTEM: OPERATIONAL")
\ No newline at end of file
@@ -16,25 +16,24 @@ class RabbitCRM:
         """
         OXIDE: Dissects the database to support client profiles and lead tracking.
         """
-        conn = MonkeyBrain.get_connection()
+        conn = MonkeyBrain.get_cached_connection()
         if not conn: return
 
         try:
-            cursor = conn.cursor()
-            # CLIENT_DIRECTORY: The master list of companies you bid to
-            cursor.execute("""
-                CREATE TABLE IF NOT EXISTS client_directory (
-                    client_id TEXT PRIMARY KEY,
-                    company_name TEXT,
-                    client_type TEXT, -- GC, OWNER, ARCHITECT
-                    primary_contact TEXT,
-                    email TEXT,
-                    payment_terms INTEGER DEFAULT 30, -- Net 30, 45, etc.
-                    reliability_rating REAL DEFAULT 5.0 -- 1.0 to 5.0 scale
-                )
-            """)
-            conn.commit()
-            conn.close()
+            with conn:
+                cursor = conn.cursor()
+                # CLIENT_DIRECTORY: The master list of companies you bid to
+                cursor.execute("""
+                    CREATE TABLE IF NOT EXISTS client_directory (
+                        client_id TEXT PRIMARY KEY,
+                        company_name TEXT,
+                        client_type TEXT, -- GC, OWNER, ARCHITECT
+                        primary_contact TEXT,
+                        email TEXT,
+                        payment_terms INTEGER DEFAULT 30, -- Net 30, 45, etc.
+                        reliability_rating REAL DEFAULT 5.0 -- 1.0 to 5.0 scale
+                    )
+                """)
         except Exception as e:
             Bananas.report_collision(e, "CRM_SCHEMA_CRASH")
 
@@ -66,13 +65,15 @@ class RabbitCRM:
             SELECT 
                 c.company_name,
                 SUM(p.gross_margin_target) / COUNT(p.project_id) as avg_planned_margin,
-                (SELECT COUNT(*) FROM core_projects WHERE client_id = ?) as project_count
+                COUNT(p.project_id) as project_count
             FROM client_directory c
             LEFT JOIN core_projects p ON c.client_id = p.client_id
             WHERE c.client_id = ?
+            GROUP BY c.company_name
         """
         # Note: This assumes a 'client_id' column was added to core_projects in the Belly.
-        return MonkeyBrain.query_oxide(query, (client_id, client_id))
+        # project_count comes off the same join - no second pass over core_projects.
+        return MonkeyBrain.query_oxide(query, (client_id,))
 
     @staticmethod
     def update_reliability(client_id, rating):
@@ -23,8 +23,9 @@ INTEGRATIONS:
 """
 
 import time
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
-from typing import List, Dict, Optional, Any
+from typing import List, Dict, Optional, Any, Tuple
 
 # ==============================================================================
 # 🍌 IMPORT BANANAS (The Shield)
@@ -56,6 +57,9 @@ except ImportError:
 # 📓 THE JOURNAL (Mock Database)
 # ==============================================================================
 
+STATUS_DRAFT = "DRAFT"
+STATUS_SUBMITTED = "SUBMITTED"
+
 MOCK_REPORTS = [
     {
         "id": "RPT-26001-001",
@@ -65,10 +69,15 @@ MOCK_REPORTS = [
         "weather": "Snow, 28F",
         "notes": "Rough-in continues on 2nd floor.",
         "blockers": [],
-        "status": "SUBMITTED"
+        "status": STATUS_SUBMITTED
     }
 ]
 
+# Journal indexes live beside the shared list, so every RabbitDaily sees the same reports.
+# Hot set of today's open drafts, kept apart from the locked history.
+_OPEN_DRAFTS = {r['id']: r for r in MOCK_REPORTS if r['status'] == STATUS_DRAFT}
+_SUBMITTED = {r['id']: r for r in MOCK_REPORTS if r['status'] != STATUS_DRAFT}
+
 
 # ==============================================================================
 # 🐰 RABBIT DAILY CLASS
@@ -81,32 +90,59 @@ class RabbitDaily:
 
     def __init__(self):
         self.reports = MOCK_REPORTS
+        self._open_drafts = _OPEN_DRAFTS
+        self._submitted = _SUBMITTED
 
     # ==========================================================================
     # 📝 REPORT GENERATION
     # ==========================================================================
 
+    def _fetch_weather(self, job_id: str) -> str:
+        """
+        Auto-Weather (Mock). Network-bound once RaptorAPI is wired in.
+        """
+        return "Clear, 45F"  # In real app, call RaptorAPI here
+
     def start_daily_report(self, job_id: str, foreman: str) -> Dict[str, Any]:
         """
         Initializes the daily log and pulls weather.
         """
-        # 1. Auto-Weather (Mock)
-        weather = "Clear, 45F"  # In real app, call RaptorAPI here
+        return self._open_report(job_id, foreman, self._fetch_weather(job_id), datetime.now())
+
+    def start_daily_reports_bulk(self, pairs: List[Tuple[str, str]]) -> List[Dict[str, Any]]:
+        """
+        Morning rollout: opens reports for many (job_id, foreman) pairs.
+        Weather for every site is fetched concurrently, so N sites cost
+        roughly one round-trip instead of N.
+        """
+        if not pairs: return []
 
-        rpt_id = f"RPT-{job_id.replace('JOB-', '')}-{datetime.now().strftime('%Y%m%d')}"
+        with ThreadPoolExecutor(max_workers=min(8, len(pairs))) as pool:
+            weathers = list(pool.map(self._fetch_weather, [job_id for job_id, _ in pairs]))
+
+        now = datetime.now()  # one clock read for the whole rollout
+        return [self._open_report(job_id, foreman, weather, now)
+                for (job_id, foreman), weather in zip(pairs, weathers)]
+
+    def _open_report(self, job_id: str, foreman: str, weather: str, now: datetime) -> Dict[str, Any]:
+        """
+        Builds the DRAFT report and files it in the journal.
+        """
+        rpt_id = f"RPT-{job_id.replace('JOB-', '')}-{now.strftime('%Y%m%d')}"
 
         report = {
             "id": rpt_id,
             "job_id": job_id,
-            "date": datetime.now().strftime("%Y-%m-%d"),
+            "date": now.strftime("%Y-%m-%d"),
             "foreman": foreman,
             "weather": weather,
             "notes": "",
             "blockers": [],
             "photos": [],
-            "status": "DRAFT"
+            "status": STATUS_DRAFT
         }
 
+        self._open_drafts[rpt_id] = report
         self.reports.append(report)
         MonkeyHeart.log_system_event("DAILY_START", f"{foreman} started report for {job_id}")
 
@@ -120,16 +156,16 @@ class RabbitDaily:
         """
         Adds a problem to the report.
         """
-        report = next((r for r in self.reports if r['id'] == report_id), None)
-        if not report: return {"success": False}
+        report = self._open_drafts.get(report_id)
+        if not report:
+            if report_id in self._submitted:
+                return {"success": False, "reason": "REPORT_LOCKED", "message": "Report already submitted."}
+            return {"success": False}
 
         # 1. Evidence Enforcement
-        if is_blocker and not has_photo:
-            return {
-                "success": False,
-                "reason": "PHOTO_REQUIRED",
-                "message": "You cannot flag a Blocker without photo evidence."
-            }
+        rejection = self._validate_issue(is_blocker, has_photo)
+        if rejection:
+            return rejection
 
         entry = {
             "text": issue_text,
@@ -147,6 +183,59 @@ class RabbitDaily:
 
         return {"success": True, "message": "Issue Logged"}
 
+    def log_issues_bulk(self, report_id: str, entries: List[Tuple[str, bool, bool]]) -> List[Dict[str, Any]]:
+        """
+        Offline -> online sync: adds many (issue_text, is_blocker, has_photo)
+        entries with one report lookup and one escalation for all new blockers.
+        Returns a per-entry result list in input order.
+        """
+        report = self._open_drafts.get(report_id)
+        if not report:
+            fail = {"success": False}
+            if report_id in self._submitted:
+                fail = {"success": False, "reason": "REPORT_LOCKED", "message": "Report already submitted."}
+            return [fail] * len(entries)
+
+        time_str = datetime.now().strftime("%H:%M")
+        accepted, results = [], []
+
+        for issue_text, is_blocker, has_photo in entries:
+            rejection = self._validate_issue(is_blocker, has_photo)
+            if rejection:
+                results.append(rejection)
+                continue
+
+            accepted.append({
+                "text": issue_text,
+                "is_blocker": is_blocker,
+                "has_photo": has_photo,
+                "time": time_str
+            })
+            results.append({"success": True, "message": "Issue Logged"})
+
+        report['blockers'].extend(accepted)
+
+        # One escalation for the whole batch
+        blocker_count = sum(1 for e in accepted if e['is_blocker'])
+        if blocker_count:
+            Bananas.notify("BLOCKER ALERT", f"{report['job_id']}: {blocker_count} new blockers")
+            MonkeyHeart.log_system_event("DAILY_BLOCKER", f"Escalated {blocker_count} blockers on {report['job_id']}")
+
+        return results
+
+    @staticmethod
+    def _validate_issue(is_blocker: bool, has_photo: bool) -> Optional[Dict[str, Any]]:
+        """
+        Evidence rules for an issue. Returns the rejection payload, or None if it passes.
+        """
+        if is_blocker and not has_photo:
+            return {
+                "success": False,
+                "reason": "PHOTO_REQUIRED",
+                "message": "You cannot flag a Blocker without photo evidence."
+            }
+        return None
+
     # ==========================================================================
     # 🔒 SUBMISSION
     # ==========================================================================
@@ -155,10 +244,11 @@ class RabbitDaily:
         """
         Finalizes the journal for the day.
         """
-        report = next((r for r in self.reports if r['id'] == report_id), None)
+        report = self._open_drafts.pop(report_id, None) or self._submitted.get(report_id)
         if not report: return False
 
-        report['status'] = "SUBMITTED"
+        report['status'] = STATUS_SUBMITTED
+        self._submitted[report_id] = report
 
         # Check for empty notes
         if len(report['notes']) < 10 and not report['blockers']:
@@ -1,9 +1,16 @@
 import pandas as pd
 from datetime import datetime
+from typing import List, Tuple
 from monkey_brain import MonkeyBrain
 from monkey_heart import MonkeyHeart
 from bananas import Bananas
 
+# (project_id, report_date, weather_conditions, notes, delay_minutes)
+INSERT_REPORT_SQL = """
+    INSERT INTO daily_reports (project_id, report_date, weather_conditions, notes, delay_minutes)
+    VALUES (?, ?, ?, ?, ?)
+"""
+
 
 class RabbitDailyReports:
     """
@@ -17,25 +24,29 @@ class RabbitDailyReports:
         """
         OXIDE: Dissects the database to hold daily field logs.
         """
-        conn = MonkeyBrain.get_connection()
+        conn = MonkeyBrain.get_cached_connection()
         if not conn: return
 
         try:
-            cursor = conn.cursor()
-            cursor.execute("""
-                CREATE TABLE IF NOT EXISTS daily_reports (
-                    report_id INTEGER PRIMARY KEY AUTOINCREMENT,
-                    project_id TEXT,
-                    report_date DATE,
-                    weather_conditions TEXT,
-                    crew_count INTEGER,
-                    notes TEXT,
-                    delay_minutes INTEGER DEFAULT 0,
-                    created_at DATETIME DEFAULT CURRENT_TIMESTAMP
-                )
-            """)
-            conn.commit()
-            conn.close()
+            with conn:
+                cursor = conn.cursor()
+                cursor.execute("""
+                    CREATE TABLE IF NOT EXISTS daily_reports (
+                        report_id INTEGER PRIMARY KEY AUTOINCREMENT,
+                        project_id TEXT,
+                        report_date DATE,
+                        weather_conditions TEXT,
+                        crew_count INTEGER,
+                        notes TEXT,
+                        delay_minutes INTEGER DEFAULT 0,
+                        created_at DATETIME DEFAULT CURRENT_TIMESTAMP
+                    )
+                """)
+                # Covering index for get_project_history (seek + pre-sorted walk, no sort step)
+                cursor.execute("""
+                    CREATE INDEX IF NOT EXISTS idx_daily_proj_date
+                    ON daily_reports (project_id, report_date DESC)
+                """)
         except Exception as e:
             Bananas.report_collision(e, "DAILY_SCHEMA_CRASH")
 
@@ -44,16 +55,27 @@ class RabbitDailyReports:
         """
         RABBIT: Rapidly inserts a daily log into the Belly.
         """
+        # Use today's date
+        today = datetime.now().strftime('%Y-%m-%d')
+        return RabbitDailyReports.log_reports_bulk([(project_id, today, weather, notes, delay)])
+
+    @staticmethod
+    def log_reports_bulk(rows: List[Tuple]):
+        """
+        RABBIT: Files a batch of daily logs (EOD sync, offline catch-up) in one transaction.
+        Each row is (project_id, report_date, weather, notes, delay_minutes).
+        """
+        if not rows: return True
+
+        conn = MonkeyBrain.get_cached_connection()
+        if not conn: return False
+
         try:
-            cmd = """
-                INSERT INTO daily_reports (project_id, report_date, weather_conditions, notes, delay_minutes)
-                VALUES (?, ?, ?, ?, ?)
-            """
-            # Use today's date
-            today = datetime.now().strftime('%Y-%m-%d')
-            MonkeyBrain.execute_oxide(cmd, (project_id, today, weather, notes, delay))
+            with conn:
+                conn.executemany(INSERT_REPORT_SQL, rows)
 
-            MonkeyHeart.log_system_event("DAILY_LOG_CREATED", f"Report filed for {project_id}")
+            projects = ", ".join(dict.fromkeys(row[0] for row in rows))
+            MonkeyHeart.log_system_event("DAILY_LOG_CREATED", f"Report filed for {projects}")
             return True
         except Exception as e:
             Bananas.report_collision(e, "DAILY_LOG_FAILURE")
@@ -64,5 +86,11 @@ class RabbitDailyReports:
         """
         RABBIT: Retrieves all past reports for a specific job.
         """
-        query = "SELECT * FROM daily_reports WHERE project_id = ? ORDER BY report_date DESC"
+        query = """
+            SELECT report_id, project_id, report_date, weather_conditions, crew_count,
+                   notes, delay_minutes, created_at
+            FROM daily_reports
+            WHERE project_id = ?
+            ORDER BY report_date DESC
+        """
         return MonkeyBrain.query_oxide(query, (project_id,))
\ No newline at end of file
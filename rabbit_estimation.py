@@ -17,23 +17,21 @@ class RabbitEstimation:
         Formula: (Materials + Labor) * Overhead * Profit
         """
         try:
-            # 1. GRIP MATERIAL TOTALS (Arms/Belly integration)
-            # Pulls all materials linked to this project's takeoff
-            mat_query = """
-                SELECT SUM(unit_cost * quantity) as total_mat 
-                FROM universal_inventory ui
-                JOIN prefab_components pc ON ui.item_id = pc.material_id
-                JOIN prefab_assemblies pa ON pc.assembly_id = pa.assembly_id
-                WHERE pa.project_id = ?
+            # 1. GRIP MATERIAL TOTALS (Arms/Belly integration) + 2. LABOR BURDEN
+            # One round-trip: materials linked to this project's takeoff and its estimated shop hours.
+            # Hours are summed in their own subquery so the component join can't multiply them.
+            totals_query = """
+                SELECT
+                    (SELECT COALESCE(SUM(ui.unit_cost * pc.quantity), 0)
+                     FROM universal_inventory ui
+                     JOIN prefab_components pc ON ui.item_id = pc.material_id
+                     JOIN prefab_assemblies pa ON pc.assembly_id = pa.assembly_id
+                     WHERE pa.project_id = ?) as total_mat,
+                    (SELECT COALESCE(SUM(est_shop_hours), 0)
+                     FROM prefab_assemblies
+                     WHERE project_id = ?) as total_hours
             """
-            mat_df = MonkeyBrain.query_oxide(mat_query, (project_id,))
-            material_cost = mat_df['total_mat'].iloc[0] if not mat_df['total_mat'].isna().all() else 0.0
-
-            # 2. CALCULATE LABOR BURDEN
-            # Pulls estimated shop and field hours
-            lab_query = "SELECT SUM(est_shop_hours) as total_hours FROM prefab_assemblies WHERE project_id = ?"
-            lab_df = MonkeyBrain.query_oxide(lab_query, (project_id,))
-            total_hours = lab_df['total_hours'].iloc[0] if not lab_df['total_hours'].isna().all() else 0.0
+            material_cost, total_hours = MonkeyBrain.query_scalar(totals_query, (project_id, project_id))
 
             # Regional Ohio Labor Rate (Hardcoded for now - move to config in future blocks)
             labor_cost = total_hours * 65.00
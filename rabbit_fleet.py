@@ -21,8 +21,9 @@ INTEGRATIONS:
 """
 
 import time
+from bisect import bisect_left, bisect_right
 from datetime import datetime
-from typing import List, Dict, Optional, Any
+from typing import List, Dict, Optional, Any, Union
 
 # ==============================================================================
 # 🍌 IMPORT BANANAS (The Shield)
@@ -47,19 +48,22 @@ try:
 except ImportError:
     class MonkeyHeart:
         @staticmethod
-        def log_system_event(event_type, message):
-            print(f"❤️ [HEARTBEAT] [{event_type}] {message}")
+        def log_system_event(event_type, message, *args):
+            print(f"❤️ [HEARTBEAT] [{event_type}] {message % args if args else message}")
 
 # ==============================================================================
 # 🚚 THE MOTOR POOL (Mock Data)
 # ==============================================================================
 
+STATUS_ACTIVE = "ACTIVE"
+STATUS_AVAILABLE = "AVAILABLE"
+
 MOCK_FLEET = [
     {
         "id": "V-01",
         "name": "Ford F-250 (The Beast)",
         "type": "TRUCK",
-        "status": "ACTIVE",
+        "status": STATUS_ACTIVE,
         "driver": "Foreman Mike",
         "odometer": 45200,
         "last_service_mileage": 40000,
@@ -70,7 +74,7 @@ MOCK_FLEET = [
         "id": "V-02",
         "name": "Ford Transit (Service 1)",
         "type": "VAN",
-        "status": "ACTIVE",
+        "status": STATUS_ACTIVE,
         "driver": "Billy",
         "odometer": 12050,
         "last_service_mileage": 10000,
@@ -81,7 +85,7 @@ MOCK_FLEET = [
         "id": "V-03",
         "name": "Chevy Express (Spare)",
         "type": "VAN",
-        "status": "AVAILABLE",
+        "status": STATUS_AVAILABLE,
         "driver": None,
         "odometer": 189000,
         "last_service_mileage": 185000,
@@ -101,36 +105,80 @@ class RabbitFleet:
     """
 
     def __init__(self):
-        self.fleet = MOCK_FLEET
+        self.fleet = [dict(v) for v in MOCK_FLEET]  # Own records: queue positions are per instance
+        self._rebuild_index()
+
+    def _rebuild_index(self):
+        """Re-keys the id -> vehicle index and the service queue. Call after adding/removing vehicles."""
+        self._by_id = {v['id']: v for v in self.fleet}
+
+        # Materialized 'miles until service', kept sorted so the due tail is a bisect away.
+        # Parallel lists: _due_miles is the sort key, _due_ids the vehicle at that slot.
+        queue = []
+        for v in self.fleet:
+            v['miles_until_service'] = v['service_interval'] - (v['odometer'] - v['last_service_mileage'])
+            queue.append((v['miles_until_service'], v['id']))
+        queue.sort()
+        self._due_miles = [m for m, _ in queue]
+        self._due_ids = [vid for _, vid in queue]
+
+    def _set_miles_until_service(self, vehicle: Dict, remaining: int):
+        """Updates the vehicle's derived field and moves it within the sorted service queue."""
+        old = vehicle.get('miles_until_service')
+        vid = vehicle['id']
+        pos = bisect_left(self._due_miles, old) if old is not None else len(self._due_miles)
+        n = len(self._due_miles)
+        while pos < n and self._due_miles[pos] == old and self._due_ids[pos] != vid:
+            pos += 1
+
+        if pos >= n or self._due_ids[pos] != vid:
+            # Not at its queued slot (record edited elsewhere, or not one of ours)
+            vehicle['miles_until_service'] = remaining
+            if self._by_id.get(vid) is vehicle:
+                self._rebuild_index()
+            return
+
+        del self._due_miles[pos]
+        del self._due_ids[pos]
+
+        vehicle['miles_until_service'] = remaining
+        pos = bisect_right(self._due_miles, remaining)
+        self._due_miles.insert(pos, remaining)
+        self._due_ids.insert(pos, vid)
 
     # ==========================================================================
     # 🛣️ MILEAGE & MAINTENANCE
     # ==========================================================================
 
-    def log_trip(self, vehicle_id: str, miles_driven: int, driver: str) -> Dict[str, Any]:
+    def log_trip(self, vehicle_or_id: Union[str, Dict], miles_driven: int, driver: str) -> Dict[str, Any]:
         """
         Updates the odometer and checks for maintenance triggers.
         """
-        vehicle = self._find_vehicle(vehicle_id)
+        vehicle = self._find_vehicle(vehicle_or_id)
         if not vehicle:
             return {"success": False, "error": "Vehicle Not Found"}
 
+        # Read the record once; all arithmetic runs on locals
+        name = vehicle['name']
+        last_service = vehicle['last_service_mileage']
+        interval = vehicle['service_interval']
+
         # Update Odometer
-        old_reading = vehicle['odometer']
-        new_reading = old_reading + miles_driven
+        new_reading = vehicle['odometer'] + miles_driven
         vehicle['odometer'] = new_reading
 
-        MonkeyHeart.log_system_event("FLEET_TRIP",
-                                     f"{vehicle['name']}: Driven {miles_driven} miles by {driver}. Total: {new_reading}")
+        MonkeyHeart.log_system_event("FLEET_TRIP", "%s: Driven %s miles by %s. Total: %s",
+                                     name, miles_driven, driver, new_reading)
 
         # Maintenance Check
-        miles_since_service = new_reading - vehicle['last_service_mileage']
+        miles_since_service = new_reading - last_service
+        self._set_miles_until_service(vehicle, interval - miles_since_service)
         alert = None
 
-        if miles_since_service >= vehicle['service_interval']:
+        if miles_since_service >= interval:
             alert = f"MAINTENANCE DUE! ({miles_since_service} miles since last oil change)"
-            Bananas.notify("Fleet Warning", f"{vehicle['name']} needs service immediately.")
-            MonkeyHeart.log_system_event("FLEET_MAINT", f"{vehicle['name']} triggered service alert.")
+            Bananas.notify("Fleet Warning", f"{name} needs service immediately.")
+            MonkeyHeart.log_system_event("FLEET_MAINT", "%s triggered service alert.", name)
 
         return {
             "success": True,
@@ -138,46 +186,66 @@ class RabbitFleet:
             "alert": alert
         }
 
-    def perform_maintenance(self, vehicle_id: str, service_notes: str):
+    def perform_maintenance(self, vehicle_or_id: Union[str, Dict], service_notes: str):
         """
         Resets the maintenance counter (Oil Change Complete).
         """
-        vehicle = self._find_vehicle(vehicle_id)
+        vehicle = self._find_vehicle(vehicle_or_id)
         if vehicle:
             current_odo = vehicle['odometer']
             vehicle['last_service_mileage'] = current_odo
+            self._set_miles_until_service(vehicle, vehicle['service_interval'])
 
-            MonkeyHeart.log_system_event("FLEET_SERVICE", f"Service Performed on {vehicle['name']}: {service_notes}")
+            MonkeyHeart.log_system_event("FLEET_SERVICE", "Service Performed on %s: %s", vehicle['name'], service_notes)
             Bananas.notify("Fleet Update", f"{vehicle['name']} is back in action.")
             return True
         return False
 
+    def check_fleet_health(self, due_within: int = 500) -> List[Dict]:
+        """
+        Vehicles that are overdue or due within `due_within` miles, most overdue first.
+        Reads only the due tail of the service queue instead of scanning the fleet.
+        """
+        end = bisect_right(self._due_miles, due_within)
+        return [self._by_id[vid] for vid in self._due_ids[:end]]
+
     # ==========================================================================
     # 🔑 ASSIGNMENT
     # ==========================================================================
 
-    def assign_vehicle(self, vehicle_id: str, driver_name: str) -> bool:
+    def assign_vehicle(self, vehicle_or_id: Union[str, Dict], driver_name: str) -> bool:
         """
         Hands the keys to a driver.
         """
-        vehicle = self._find_vehicle(vehicle_id)
+        vehicle = self._find_vehicle(vehicle_or_id)
         if not vehicle:
             return False
 
-        if vehicle['status'] != 'AVAILABLE' and vehicle['driver'] != driver_name:
+        # Idempotent re-assign (UI retry): nothing to write, nothing to log
+        if vehicle['driver'] == driver_name and vehicle['status'] == STATUS_ACTIVE:
+            return True
+
+        if vehicle['status'] != STATUS_AVAILABLE and vehicle['driver'] != driver_name:
             # Force reassignment logic
-            MonkeyHeart.log_system_event("FLEET_SWAP",
-                                         f"Reassigning {vehicle['name']} from {vehicle['driver']} to {driver_name}")
+            MonkeyHeart.log_system_event("FLEET_SWAP", "Reassigning %s from %s to %s",
+                                         vehicle['name'], vehicle['driver'], driver_name)
 
         vehicle['driver'] = driver_name
-        vehicle['status'] = 'ACTIVE'
+        vehicle['status'] = STATUS_ACTIVE
         return True
 
-    def _find_vehicle(self, v_id: str) -> Optional[Dict]:
-        for v in self.fleet:
-            if v['id'] == v_id:
-                return v
-        return None
+    def get_vehicle(self, vehicle_id: str) -> Optional[Dict]:
+        """
+        Resolves a vehicle once (e.g. from a scanned QR label). The record can be
+        passed straight to log_trip / perform_maintenance / assign_vehicle.
+        """
+        return self._by_id.get(vehicle_id)
+
+    def _find_vehicle(self, vehicle_or_id: Union[str, Dict]) -> Optional[Dict]:
+        if isinstance(vehicle_or_id, dict):
+            # Prefer our own record for that id, so the service queue stays in sync
+            return self._by_id.get(vehicle_or_id.get('id'), vehicle_or_id)
+        return self._by_id.get(vehicle_or_id)
 
 
 # ==============================================================================
@@ -205,10 +273,12 @@ if __name__ == "__main__":
 
     # 4. Perform Service
     print("\n[TEST 3] Performing Oil Change on V-01...")
-    garage.perform_maintenance("V-01", "Oil Change & Tire Rotation")
+    # Resolve once, then hand the record through the workflow
+    v = garage.get_vehicle("V-01")
+    garage.perform_maintenance(v, "Oil Change & Tire Rotation")
 
     # 5. Verify Reset
-    v = garage._find_vehicle("V-01")
+    print(f" > Due Now: {[d['id'] for d in garage.check_fleet_health()]}")
     print(f" > Last Service Reset To: {v['last_service_mileage']}")
 
     print("\n" + "=" * 40)
@@ -1,10 +1,22 @@
 import pandas as pd
-import io
 from datetime import datetime
 from monkey_heart import MonkeyHeart
 from monkey_brain import MonkeyBrain
 from bananas import Bananas
 
+# Foundation Software requires specific CSV headers (A-E format).
+# We transform our 'Monkey' data into 'Accounting' data here, in SQL,
+# so pandas never has to patch columns onto the frame afterwards.
+ACCOUNTING_SELECT = """
+    SELECT project_id as [Job Number], 
+           project_name as [Description], 
+           trade_focus as [Department],
+           gross_margin_target as [Estimated Profit],
+           'OH-CONTRACTOR-01' as [Customer ID], -- Placeholder for Client Mapping
+           'A' as [Status Code] -- Active
+    FROM core_projects
+"""
+
 
 class RabbitFoundation:
     """
@@ -20,20 +32,10 @@ class RabbitFoundation:
         required by enterprise accounting software.
         """
         try:
-            query = """
-                SELECT project_id as [Job Number], 
-                       project_name as [Description], 
-                       trade_focus as [Department],
-                       gross_margin_target as [Estimated Profit]
-                FROM core_projects WHERE project_id = ?
-            """
+            query = ACCOUNTING_SELECT + " WHERE project_id = ?"
             df = MonkeyBrain.query_oxide(query, (project_id,))
 
-            # Foundation Software requires specific CSV headers (A-E format)
-            # We transform our 'Monkey' data into 'Accounting' data here.
             if not df.empty:
-                df['Customer ID'] = "OH-CONTRACTOR-01"  # Placeholder for Client Mapping
-                df['Status Code'] = "A"  # Active
                 return df
             return None
 
@@ -41,16 +43,58 @@ class RabbitFoundation:
             Bananas.report_collision(e, "FOUNDATION_MAPPING_FAILURE")
             return None
 
+    @staticmethod
+    def dissect_for_accounting_bulk(project_ids):
+        """
+        OXIDE: One query for a whole batch of jobs, plus the per-Department
+        rollup (first job, total estimated profit, job count) computed in a
+        single groupby pass. Returns (mapped_df, rollup_df) or (None, None).
+        """
+        try:
+            ids = list(dict.fromkeys(project_ids))
+            if not ids:
+                return None, None
+
+            placeholders = ", ".join("?" * len(ids))
+            query = ACCOUNTING_SELECT + f" WHERE project_id IN ({placeholders})"
+            df = MonkeyBrain.query_oxide(query, tuple(ids))
+            if df.empty:
+                return None, None
+
+            # Category keys hash once per distinct value instead of per object row
+            df['Job Number'] = df['Job Number'].astype('category')
+            df['Department'] = df['Department'].astype('category')
+
+            rollup = df.groupby('Department', observed=True).agg(
+                first_job=('Job Number', 'first'),
+                total_estimated_profit=('Estimated Profit', 'sum'),
+                job_count=('Job Number', 'size')
+            )
+            return df, rollup
+
+        except Exception as e:
+            Bananas.report_collision(e, "FOUNDATION_MAPPING_FAILURE")
+            return None, None
+
     @staticmethod
     def generate_csv_export(df):
         """
         OXIDE: Converts the mapped dataframe into a downloadable buffer
         for the user to upload into Foundation Software.
         """
-        output = io.BytesIO()
-        df.to_csv(output, index=False)
-        processed_data = output.getvalue()
-        return processed_data
+        return b"".join(RabbitFoundation.generate_csv_stream(df))
+
+    @staticmethod
+    def generate_csv_stream(df, chunksize=5000):
+        """
+        OXIDE: Yields the export as CSV byte chunks (header first, then
+        `chunksize` rows at a time) so large job-cost exports never sit
+        fully in memory. Hand it straight to a streaming response, e.g.
+        StreamingResponse(RabbitFoundation.generate_csv_stream(df), media_type="text/csv").
+        """
+        yield df.iloc[0:0].to_csv(index=False).encode("utf-8")
+        for start in range(0, len(df), chunksize):
+            yield df.iloc[start:start + chunksize].to_csv(header=False, index=False).encode("utf-8")
 
     @staticmethod
     def get_phase_codes(trade_focus):
@@ -2,6 +2,22 @@ import math
 from monkey_heart import MonkeyHeart
 from bananas import Bananas
 
+# NumPy is optional: the bulk load calc vectorizes when it is present
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+# Folded constants: multiply by reciprocals instead of dividing per call
+_INV_144 = 1.0 / 144  # sq in -> sq ft
+_INV_12000 = 1.0 / 12000  # BTU/h -> tons
+_BASE_BTU_PER_CU_FT = 20
+
+
+def _per_room(value, count):
+    """Broadcasts a scalar to one value per room (the list fallback for NumPy's broadcasting)."""
+    return list(value) if isinstance(value, (list, tuple)) else [value] * count
+
 
 class RabbitHVAC:
     """
@@ -18,7 +34,7 @@ class RabbitHVAC:
         Target: Maintaining quiet and efficient airflow (typically < 1000 FPM for residential).
         """
         try:
-            area_sq_ft = area_sq_in / 144
+            area_sq_ft = area_sq_in * _INV_144
             velocity = cfm / area_sq_ft
 
             status = "OPTIMAL" if velocity <= 1200 else "TURBULENT"
@@ -42,8 +58,9 @@ class RabbitHVAC:
         try:
             volume = sq_ft * ceiling_height
             # Simplified base calc: Volume * factor
-            estimated_btu = volume * 20 * insulation_factor
-            tonnage = estimated_btu / 12000
+            heat_factor = _BASE_BTU_PER_CU_FT * insulation_factor
+            estimated_btu = volume * heat_factor
+            tonnage = estimated_btu * _INV_12000
 
             return {
                 "estimated_btu_h": round(estimated_btu, 2),
@@ -53,6 +70,39 @@ class RabbitHVAC:
         except Exception as e:
             Bananas.report_collision(e, "THERMAL_LOAD_FAILURE")
 
+    @staticmethod
+    def btu_load_dissection_bulk(sq_ft, ceiling_heights=8, insulation_factors=1.2):
+        """
+        OXIDE: Vectorized btu_load_dissection for a whole estimate's rooms.
+        Takes arrays (or scalars, broadcast) and returns arrays in the same shape;
+        without NumPy, takes a list of areas and returns lists.
+        """
+        try:
+            if np is None:
+                count = len(sq_ft)
+                estimated = [
+                    area * height * _BASE_BTU_PER_CU_FT * factor
+                    for area, height, factor in zip(sq_ft, _per_room(ceiling_heights, count),
+                                                    _per_room(insulation_factors, count))
+                ]
+                return {
+                    "estimated_btu_h": [round(btu, 2) for btu in estimated],
+                    "required_tonnage": [round(btu * _INV_12000, 1) for btu in estimated],
+                    "insulation_multiplier": insulation_factors
+                }
+
+            volume = np.asarray(sq_ft, dtype=float) * np.asarray(ceiling_heights, dtype=float)
+            heat_factor = _BASE_BTU_PER_CU_FT * np.asarray(insulation_factors, dtype=float)
+            estimated_btu = volume * heat_factor
+
+            return {
+                "estimated_btu_h": np.round(estimated_btu, 2),
+                "required_tonnage": np.round(estimated_btu * _INV_12000, 1),
+                "insulation_multiplier": insulation_factors
+            }
+        except Exception as e:
+            Bananas.report_collision(e, "THERMAL_LOAD_FAILURE")
+
     @staticmethod
     def get_sheet_metal_labor_units(item_category):
         """
@@ -0,0 +1,15 @@
+"""
+RABBIT IDS V7.0
+Shared document-ID helpers for the Rabbit modules.
+
+DESCRIPTION:
+Change orders, punch lists and warranties all number their documents off
+the bare job number. The helpers live here so every module agrees on it.
+"""
+
+
+def strip_job_prefix(job_id: str) -> str:
+    """
+    'JOB-26001' -> '26001'. Prefix slice, no full-string replace.
+    """
+    return job_id[4:] if job_id.startswith("JOB-") else job_id
\ No newline at end of file
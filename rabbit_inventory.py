@@ -20,10 +20,11 @@ CORE CAPABILITIES:
 INTEGRATIONS:
 - Bananas (Alerts)
 - Monkey Heart (Financial Logging)
+- SQLite 'van_stock' table (optional write path)
 """
 
-import time
-from datetime import datetime
+import sqlite3
+from array import array
 from typing import List, Dict, Optional, Any
 
 # ==============================================================================
@@ -49,8 +50,8 @@ try:
 except ImportError:
     class MonkeyHeart:
         @staticmethod
-        def log_system_event(event_type, message):
-            print(f"❤️ [HEARTBEAT] [{event_type}] {message}")
+        def log_system_event(event_type, message, *args):
+            print(f"❤️ [HEARTBEAT] [{event_type}] {message % args if args else message}")
 
         @staticmethod
         def log_financial_event(job_id, amount, description, user):
@@ -60,26 +61,93 @@ except ImportError:
 # 📦 THE WAREHOUSE (Mock Data)
 # ==============================================================================
 # In production, this is 'monkey_brain.db' -> 'inventory' table.
+# Unit cost is held in integer cents; dollars only appear at the API boundary.
+
+CATEGORY_ROUGH = "ROUGH"
+CATEGORY_WIRE = "WIRE"
+CATEGORY_FINISH = "FINISH"
+PHASE_ALL = "ALL"
 
 MOCK_INVENTORY = [
     # ROUGH-IN MATERIALS
-    {"sku": "BOX-4SQ-D", "name": "4-Square Box Deep", "category": "ROUGH", "qty": 5000, "par": 1000, "cost": 2.15},
-    {"sku": "EMT-1/2", "name": "1/2 Inch EMT (10ft)", "category": "ROUGH", "qty": 2000, "par": 500, "cost": 4.50},
-    {"sku": "CONN-SS-1/2", "name": "1/2 SS Connector", "category": "ROUGH", "qty": 3000, "par": 500, "cost": 0.45},
-    {"sku": "GRD-SCREW", "name": "Green Ground Screw", "category": "ROUGH", "qty": 10000, "par": 1000, "cost": 0.10},
+    {"sku": "BOX-4SQ-D", "name": "4-Square Box Deep", "category": CATEGORY_ROUGH, "qty": 5000, "par": 1000, "cost_cents": 215},
+    {"sku": "EMT-1/2", "name": "1/2 Inch EMT (10ft)", "category": CATEGORY_ROUGH, "qty": 2000, "par": 500, "cost_cents": 450},
+    {"sku": "CONN-SS-1/2", "name": "1/2 SS Connector", "category": CATEGORY_ROUGH, "qty": 3000, "par": 500, "cost_cents": 45},
+    {"sku": "GRD-SCREW", "name": "Green Ground Screw", "category": CATEGORY_ROUGH, "qty": 10000, "par": 1000, "cost_cents": 10},
 
     # WIRE
-    {"sku": "WIRE-THHN-12-BLK", "name": "THHN #12 Black (500ft)", "category": "WIRE", "qty": 50, "par": 10,
-     "cost": 65.00},
-    {"sku": "WIRE-MC-12/2", "name": "12/2 MC Cable (250ft)", "category": "WIRE", "qty": 20, "par": 5, "cost": 120.00},
+    {"sku": "WIRE-THHN-12-BLK", "name": "THHN #12 Black (500ft)", "category": CATEGORY_WIRE, "qty": 50, "par": 10,
+     "cost_cents": 6500},
+    {"sku": "WIRE-MC-12/2", "name": "12/2 MC Cable (250ft)", "category": CATEGORY_WIRE, "qty": 20, "par": 5, "cost_cents": 12000},
 
     # FINISH
-    {"sku": "DEV-DUPLEX-W", "name": "Duplex Receptacle (White)", "category": "FINISH", "qty": 200, "par": 50,
-     "cost": 1.25},
-    {"sku": "PLATE-1G-W", "name": "1-Gang Plate (White)", "category": "FINISH", "qty": 300, "par": 50, "cost": 0.50}
+    {"sku": "DEV-DUPLEX-W", "name": "Duplex Receptacle (White)", "category": CATEGORY_FINISH, "qty": 200, "par": 50,
+     "cost_cents": 125},
+    {"sku": "PLATE-1G-W", "name": "1-Gang Plate (White)", "category": CATEGORY_FINISH, "qty": 300, "par": 50, "cost_cents": 50}
 ]
 
 
+# ==============================================================================
+# 🗄️ THE LEDGER WRITE PATH (SQLite)
+# ==============================================================================
+
+class InventoryDB:
+    """
+    Thin SQLite write path for the 'van_stock' table.
+    The SQL text is constant, so sqlite3's per-connection statement cache
+    reuses the prepared plan on every call instead of re-parsing.
+    """
+
+    SCHEMA_SQL = """
+        CREATE TABLE IF NOT EXISTS van_stock (
+            sku TEXT PRIMARY KEY,
+            name TEXT NOT NULL,
+            category TEXT NOT NULL,
+            qty INTEGER NOT NULL,
+            par INTEGER NOT NULL,
+            cost_cents INTEGER NOT NULL
+        )
+    """
+    SEED_SQL = "INSERT OR IGNORE INTO van_stock (sku, name, category, qty, par, cost_cents) VALUES (?, ?, ?, ?, ?, ?)"
+    # NSF is enforced by the WHERE clause, so check-and-decrement is one atomic statement
+    DEDUCT_SQL = "UPDATE van_stock SET qty = qty - ? WHERE sku = ? AND qty >= ?"
+    RESTOCK_SQL = "UPDATE van_stock SET qty = qty + ? WHERE sku = ?"
+    FIND_SQL = "SELECT qty, cost_cents, par, name FROM van_stock WHERE sku = ?"
+
+    def __init__(self, conn: sqlite3.Connection):
+        self.conn = conn
+
+    def ensure_schema(self, seed: Optional[List[Dict]] = None):
+        """Creates the table and optionally seeds it (existing SKUs are left alone)."""
+        with self.conn:
+            self.conn.execute(self.SCHEMA_SQL)
+            if seed:
+                self.conn.executemany(self.SEED_SQL, [
+                    (r['sku'], r['name'], r['category'], r['qty'], r['par'], r['cost_cents']) for r in seed
+                ])
+
+    def deduct(self, sku: str, qty: int):
+        """
+        Runs the guarded UPDATE, then reads the row back in the same transaction.
+        Returns (deducted, row) where row is (qty, cost_cents, par, name) or None.
+        """
+        with self.conn:
+            deducted = self.conn.execute(self.DEDUCT_SQL, (qty, sku, qty)).rowcount == 1
+            row = self.conn.execute(self.FIND_SQL, (sku,)).fetchone()
+        return deducted, (tuple(row) if row is not None else None)
+
+    def restock(self, sku: str, qty: int):
+        """
+        Atomic increment plus read-back in one transaction.
+        Returns the row (qty, cost_cents, par, name), or None for an unknown SKU.
+        """
+        with self.conn:
+            if self.conn.execute(self.RESTOCK_SQL, (qty, sku)).rowcount != 1:
+                return None
+            row = self.conn.execute(self.FIND_SQL, (sku,)).fetchone()
+        return tuple(row)
+
+
 # ==============================================================================
 # 🐰 RABBIT INVENTORY CLASS
 # ==============================================================================
@@ -87,10 +155,58 @@ MOCK_INVENTORY = [
 class RabbitInventory:
     """
     The Stock Keeper.
+    Stock is held column-wise (SoA): one typed array per hot field, addressed
+    by row index, so par/cost scans touch only the numbers they need.
     """
 
-    def __init__(self):
-        self.stock = MOCK_INVENTORY
+    def __init__(self, conn: Optional[sqlite3.Connection] = None):
+        self._load(MOCK_INVENTORY)
+        # With a connection, deductions go through the ledger; the columns mirror it
+        self._db = InventoryDB(conn) if conn is not None else None
+
+    def _load(self, records: List[Dict]):
+        """Splits row records into columns and builds the indexes."""
+        self._skus = [r['sku'] for r in records]
+        self._names = [r['name'] for r in records]
+        self._categories = [r['category'] for r in records]
+        self._qty = array('q', (r['qty'] for r in records))
+        self._par = array('q', (r['par'] for r in records))
+        self._cost_cents = array('q', (r['cost_cents'] for r in records))
+        self._rebuild_index()
+
+    def _rebuild_index(self):
+        """Re-keys the sku -> row and category -> rows indexes. Call after adding/removing SKUs."""
+        self._by_sku = {sku: idx for idx, sku in enumerate(self._skus)}
+        self._by_category = {}
+        for idx, category in enumerate(self._categories):
+            self._by_category.setdefault(category, []).append(idx)
+        # phase -> cached row dicts; a write drops only the buckets holding that row
+        self._menu_cache = {}
+
+    def _invalidate(self, idx: int):
+        """Drops the cached menu views that contain row `idx`. Call after any write to it."""
+        self._menu_cache.pop(self._categories[idx], None)
+        self._menu_cache.pop(PHASE_ALL, None)
+
+    def as_dict(self, idx: int) -> Dict[str, Any]:
+        """Row view for API boundaries that still speak dicts."""
+        return {
+            "sku": self._skus[idx],
+            "name": self._names[idx],
+            "category": self._categories[idx],
+            "qty": self._qty[idx],
+            "par": self._par[idx],
+            "cost": self._cost_cents[idx] / 100,
+            "cost_cents": self._cost_cents[idx]
+        }
+
+    @property
+    def stock(self) -> List[Dict]:
+        """Every SKU as a row dict (cached snapshot - treat as read-only)."""
+        rows = self._menu_cache.get(PHASE_ALL)
+        if rows is None:
+            rows = self._menu_cache[PHASE_ALL] = [self.as_dict(idx) for idx in range(len(self._skus))]
+        return rows
 
     # ==========================================================================
     # 🛒 SMART STOREFRONT (The Menu)
@@ -104,11 +220,14 @@ class RabbitInventory:
         ARGS:
             phase: 'ROUGH', 'WIRE', 'FINISH', 'ALL'
         """
-        if phase == 'ALL':
+        if phase == PHASE_ALL:
             return self.stock
 
-        filtered = [item for item in self.stock if item['category'] == phase]
-        MonkeyHeart.log_system_event("INV_FILTER", f"Filtered Storefront for '{phase}' ({len(filtered)} items)")
+        # Buckets hold row indexes; views are built from the live columns once per write
+        filtered = self._menu_cache.get(phase)
+        if filtered is None:
+            filtered = self._menu_cache[phase] = [self.as_dict(idx) for idx in self._by_category.get(phase, ())]
+        MonkeyHeart.log_system_event("INV_FILTER", "Filtered Storefront for '%s' (%d items)", phase, len(filtered))
         return filtered
 
     # ==========================================================================
@@ -119,58 +238,110 @@ class RabbitInventory:
         """
         Moves item from Warehouse to Job. Logs cost.
         """
-        item = self._find_item(sku)
+        if self._db is not None:
+            return self._deduct_stock_db(sku, qty, job_id, user)
 
-        if not item:
+        idx = self._find_item(sku)
+
+        if idx is None:
             Bananas.notify("Inventory Error", f"SKU {sku} not found.")
             return {"success": False}
 
-        if item['qty'] < qty:
-            Bananas.notify("Low Stock", f"Only {item['qty']} of {item['name']} available.")
+        # Bind the row's fields once; the columns are only indexed here
+        on_hand = self._qty[idx]
+        name = self._names[idx]
+
+        if on_hand < qty:
+            Bananas.notify("Low Stock", f"Only {on_hand} of {name} available.")
             return {"success": False, "reason": "NSF"}
 
         # Execute Move
-        item['qty'] -= qty
-        total_cost = round(item['cost'] * qty, 2)
+        new_qty = on_hand - qty
+        self._qty[idx] = new_qty
+        self._invalidate(idx)
+        return self._charge(sku, name, qty, self._cost_cents[idx], self._par[idx], new_qty, job_id, user)
+
+    def _deduct_stock_db(self, sku: str, qty: int, job_id: str, user: str) -> Dict[str, Any]:
+        """Ledger-backed deduction: one atomic UPDATE, one read-back, no lost updates."""
+        deducted, row = self._db.deduct(sku, qty)
+
+        if row is None:
+            Bananas.notify("Inventory Error", f"SKU {sku} not found.")
+            return {"success": False}
+
+        new_qty, cost_cents, par, name = row
+        if not deducted:
+            Bananas.notify("Low Stock", f"Only {new_qty} of {name} available.")
+            return {"success": False, "reason": "NSF"}
+
+        # Keep the in-memory columns (menu) in step with the ledger
+        idx = self._find_item(sku)
+        if idx is not None:
+            self._qty[idx] = new_qty
+            self._invalidate(idx)
+        return self._charge(sku, name, qty, cost_cents, par, new_qty, job_id, user)
+
+    def _charge(self, sku: str, name: str, qty: int, cost_cents: int, par: int, new_qty: int,
+                job_id: str, user: str) -> Dict[str, Any]:
+        """Books a completed deduction: audit log, par alert, API result."""
+        total_cents = cost_cents * qty
+        total_cost = total_cents / 100
 
         # Financial Log
-        MonkeyHeart.log_financial_event(job_id, total_cost, f"Internal Transfer: {qty}x {item['name']}", user)
+        MonkeyHeart.log_financial_event(job_id, total_cost, f"Internal Transfer: {qty}x {name}", user)
 
-        # Check Par Level
-        self._check_par(item)
+        # Alert once, on the deduction that crosses par - not on every pull below it
+        if new_qty <= par < new_qty + qty:
+            self._alert_par(sku, name, new_qty, par)
 
         return {
             "success": True,
-            "new_qty": item['qty'],
-            "cost_charged": total_cost
+            "new_qty": new_qty,
+            "cost_charged": total_cost,
+            "cost_charged_cents": total_cents
         }
 
     def restock_item(self, sku: str, qty: int):
         """
         Adds inventory (from Vendor PO).
         """
-        item = self._find_item(sku)
-        if item:
-            item['qty'] += qty
-            MonkeyHeart.log_system_event("INV_RESTOCK", f"Added {qty} to {item['name']}. Total: {item['qty']}")
+        if self._db is not None:
+            return self._restock_item_db(sku, qty)
+
+        idx = self._find_item(sku)
+        if idx is not None:
+            self._qty[idx] += qty
+            self._invalidate(idx)
+            MonkeyHeart.log_system_event("INV_RESTOCK", "Added %s to %s. Total: %s", qty, self._names[idx], self._qty[idx])
             return True
         return False
 
+    def _restock_item_db(self, sku: str, qty: int):
+        """Ledger-backed restock: the increment lands in van_stock, the columns mirror it."""
+        row = self._db.restock(sku, qty)
+        if row is None:
+            return False
+
+        new_qty, _cost_cents, _par, name = row
+        idx = self._find_item(sku)
+        if idx is not None:
+            self._qty[idx] = new_qty
+            self._invalidate(idx)
+        MonkeyHeart.log_system_event("INV_RESTOCK", "Added %s to %s. Total: %s", qty, name, new_qty)
+        return True
+
     # ==========================================================================
     # ⚠️ ALERTS
     # ==========================================================================
 
-    def _check_par(self, item: Dict):
-        """Checks if we are running low."""
-        if item['qty'] <= item['par']:
-            Bananas.notify("Restock Alert", f"{item['name']} is below par ({item['qty']}/{item['par']}). Order now.")
-            MonkeyHeart.log_system_event("INV_LOW", f"SKU {item['sku']} triggered Par Alert.")
+    def _alert_par(self, sku: str, name: str, qty: int, par: int):
+        """We are running low."""
+        Bananas.notify("Restock Alert", f"{name} is below par ({qty}/{par}). Order now.")
+        MonkeyHeart.log_system_event("INV_LOW", "SKU %s triggered Par Alert.", sku)
 
-    def _find_item(self, sku: str) -> Optional[Dict]:
-        for i in self.stock:
-            if i['sku'] == sku:
-                return i
-        return None
+    def _find_item(self, sku: str) -> Optional[int]:
+        """Row index for a SKU, or None."""
+        return self._by_sku.get(sku)
 
 
 # ==============================================================================
@@ -199,5 +370,15 @@ if __name__ == "__main__":
     # Has 50, Par 10. We take 45.
     warehouse.deduct_stock("WIRE-THHN-12-BLK", 45, "JOB-26001", "Mike")
 
+    # 5. Test Ledger Write Path
+    print("\n[TEST 4] Deducting through an in-memory SQLite ledger...")
+    ledger = sqlite3.connect(":memory:")
+    InventoryDB(ledger).ensure_schema(seed=MOCK_INVENTORY)
+    db_warehouse = RabbitInventory(conn=ledger)
+    res = db_warehouse.deduct_stock("EMT-1/2", 25, "JOB-26001", "Foreman Mike")
+    print(f" > Status: {res['success']} | New Qty: {res['new_qty']}")
+    res = db_warehouse.deduct_stock("EMT-1/2", 99999, "JOB-26001", "Foreman Mike")
+    print(f" > Oversized Order Rejected: {res.get('reason')}")
+
     print("\n" + "=" * 40)
     print("🐰 RABBIT INVENTORY SYSTEM: OPERATIONAL")
\ No newline at end of file
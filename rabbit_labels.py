@@ -1,10 +1,35 @@
 import qrcode
+from functools import lru_cache
 from io import BytesIO
 from monkey_heart import MonkeyHeart
 from monkey_brain import MonkeyBrain
 from bananas import Bananas
 
 
+@lru_cache(maxsize=1024)
+def _render_qr_png(data_string):
+    """
+    Encodes + PNG-serializes one payload. Deterministic, so reprints of the
+    same kit/asset/doc label come straight from the cache. Errors propagate
+    (and are not cached).
+    """
+    qr = qrcode.QRCode(
+        version=1,
+        error_correction=qrcode.constants.ERROR_CORRECT_L,
+        box_size=10,
+        border=4,
+    )
+    qr.add_data(data_string)
+    qr.make(fit=True)
+
+    img = qr.make_image(fill_color="black", back_color="white")
+
+    # Save to buffer for Streamlit/Web display
+    buf = BytesIO()
+    img.save(buf, format="PNG")
+    return buf.getvalue()
+
+
 class RabbitLabels:
     """
     RABBIT PROTOCOL: High-speed lateral expansion for Field Identification.
@@ -19,21 +44,7 @@ class RabbitLabels:
         Returns a PIL image object for UI rendering or printing.
         """
         try:
-            qr = qrcode.QRCode(
-                version=1,
-                error_correction=qrcode.constants.ERROR_CORRECT_L,
-                box_size=10,
-                border=4,
-            )
-            qr.add_data(data_string)
-            qr.make(fit=True)
-
-            img = qr.make_image(fill_color="black", back_color="white")
-
-            # Save to buffer for Streamlit/Web display
-            buf = BytesIO()
-            img.save(buf, format="PNG")
-            return buf.getvalue()
+            return _render_qr_png(data_string)
 
         except Exception as e:
             Bananas.report_collision(e, "QR_GENERATION_FAILURE")
@@ -22,10 +22,14 @@ INTEGRATIONS:
 - Raptor Maps (Mileage Data)
 """
 
-import time
-from datetime import datetime, timedelta
 from typing import List, Dict, Optional, Any
 
+# NumPy is optional: big fleets get a vectorized health sweep when it is present
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
 # ==============================================================================
 # 🍌 IMPORT BANANAS (The Shield)
 # ==============================================================================
@@ -49,13 +53,17 @@ try:
 except ImportError:
     class MonkeyHeart:
         @staticmethod
-        def log_system_event(event_type, message):
-            print(f"❤️ [HEARTBEAT] [{event_type}] {message}")
+        def log_system_event(event_type, message, *args):
+            print(f"❤️ [HEARTBEAT] [{event_type}] {message % args if args else message}")
 
 # ==============================================================================
 # 🚐 THE GARAGE (Mock Database)
 # ==============================================================================
 
+HEALTH_GOOD = "GOOD"
+HEALTH_DUE_SOON = "DUE_SOON"
+HEALTH_OVERDUE = "OVERDUE"
+
 MOCK_FLEET = [
     {
         "id": "VAN-04",
@@ -89,8 +97,16 @@ class RabbitLegs:
     The Fleet Manager.
     """
 
+    # Driver-score penalty per telematics event (unknown events cost nothing)
+    _PENALTY = {"HARSH_BRAKE": 2, "RAPID_ACCEL": 1, "SPEEDING": 5}
+
     def __init__(self):
-        self.fleet = MOCK_FLEET
+        self.fleet = [dict(v) for v in MOCK_FLEET]  # Own records: updates never touch the module mock
+        self._rebuild_index()
+
+    def _rebuild_index(self):
+        """Re-keys the id -> vehicle index. Call after adding/removing vehicles."""
+        self._by_id = {v['id']: v for v in self.fleet}
 
     # ==========================================================================
     # 🛠️ MAINTENANCE HEALTH
@@ -102,24 +118,36 @@ class RabbitLegs:
         """
         alerts = []
         service_interval = 5000  # Miles
-
-        for vehicle in self.fleet:
-            miles_since = vehicle['odometer'] - vehicle['last_service_odo']
-            remaining = service_interval - miles_since
-
-            status = "GOOD"
-            if remaining < 0:
-                status = "OVERDUE"
-                msg = f"{vehicle['id']} is OVERDUE by {abs(remaining)} miles!"
-                alerts.append(msg)
+        fleet = self.fleet
+
+        # Odometers are read from the live records each sweep, so updates are always seen
+        if np is not None:
+            count = len(fleet)
+            odo = np.fromiter((v['odometer'] for v in fleet), dtype=np.int64, count=count)
+            last_svc = np.fromiter((v['last_service_odo'] for v in fleet), dtype=np.int64, count=count)
+            remaining = service_interval - (odo - last_svc)
+            # Only overdue / due-soon vehicles reach the Python loop
+            flagged = np.flatnonzero(remaining < 500).tolist()
+            remaining = remaining.tolist()
+        else:
+            remaining = [service_interval - (v['odometer'] - v['last_service_odo']) for v in fleet]
+            flagged = [idx for idx, left in enumerate(remaining) if left < 500]
+
+        for idx in flagged:
+            vehicle, left = fleet[idx], remaining[idx]
+            if left < 0:
+                status = HEALTH_OVERDUE
+                msg = f"{vehicle['id']} is OVERDUE by {abs(left)} miles!"
                 Bananas.notify("Maintenance Alert", msg)
-            elif remaining < 500:
-                status = "DUE_SOON"
-                msg = f"{vehicle['id']} due for service in {remaining} miles."
-                alerts.append(msg)
-
-            MonkeyHeart.log_system_event("FLEET_CHECK", f"{vehicle['id']}: {status} (Miles Since: {miles_since})")
-
+            else:
+                status = HEALTH_DUE_SOON
+                msg = f"{vehicle['id']} due for service in {left} miles."
+            alerts.append(msg)
+            MonkeyHeart.log_system_event("FLEET_CHECK", "%s: %s (Miles Since: %s)",
+                                         vehicle['id'], status, service_interval - left)
+
+        MonkeyHeart.log_system_event("FLEET_CHECK", "%s vehicles checked, %s %s",
+                                     len(fleet), len(fleet) - len(flagged), HEALTH_GOOD)
         return alerts
 
     # ==========================================================================
@@ -130,13 +158,13 @@ class RabbitLegs:
         """
         Checks if a specific van has the parts we need.
         """
-        vehicle = next((v for v in self.fleet if v['id'] == vehicle_id), None)
+        vehicle = self._by_id.get(vehicle_id)
         if not vehicle: return False
 
         on_hand = vehicle['inventory'].get(item_sku, 0)
 
         if on_hand >= qty_needed:
-            MonkeyHeart.log_system_event("FLEET_STOCK", f"{vehicle_id} has {on_hand} of {item_sku}. USE IT.")
+            MonkeyHeart.log_system_event("FLEET_STOCK", "%s has %s of %s. USE IT.", vehicle_id, on_hand, item_sku)
             return True
         else:
             return False
@@ -150,20 +178,16 @@ class RabbitLegs:
         Logs harsh events and dings the driver's score.
         Events: HARSH_BRAKE, RAPID_ACCEL, SPEEDING.
         """
-        vehicle = next((v for v in self.fleet if v['id'] == vehicle_id), None)
+        vehicle = self._by_id.get(vehicle_id)
         if not vehicle: return
 
         # Penalties
-        penalty = 0
-        if event_type == "HARSH_BRAKE":
-            penalty = 2
-        elif event_type == "SPEEDING":
-            penalty = 5
+        penalty = self._PENALTY.get(event_type, 0)
 
         vehicle['driver_score'] -= penalty
 
-        MonkeyHeart.log_system_event("FLEET_SAFETY",
-                                     f"{vehicle['driver']} ({vehicle_id}) flagged for {event_type}. Score: {vehicle['driver_score']}")
+        MonkeyHeart.log_system_event("FLEET_SAFETY", "%s (%s) flagged for %s. Score: %s",
+                                     vehicle['driver'], vehicle_id, event_type, vehicle['driver_score'])
 
         if vehicle['driver_score'] < 80:
             Bananas.notify("Driver Warning", f"{vehicle['driver']} score dropped to {vehicle['driver_score']}!")
@@ -11,50 +11,106 @@ class RabbitManpower:
     Target: 100% Visibility into field labor utilization and compliance.
     """
 
+    # Params: (project_id, emp_id, hours, work_date, desc). The employee's rate is frozen
+    # into rate_at_log at write time, so cost reads never join the roster.
+    INSERT_LABOR_SQL = """
+        INSERT INTO labor_logs (project_id, emp_id, hours_worked, rate_at_log, work_date, description)
+        VALUES (?1, ?2, ?3, (SELECT hourly_rate FROM employee_roster WHERE emp_id = ?2), ?4, ?5)
+    """
+
+    # Adds one log's cost (hours x the employee's current rate) to the project's cached total
+    COST_CACHE_BUMP_SQL = """
+        INSERT INTO project_labor_cost_cache (project_id, total_labor_cost, last_refreshed)
+        SELECT ?, ? * hourly_rate, datetime('now') FROM employee_roster WHERE emp_id = ?
+        ON CONFLICT(project_id) DO UPDATE SET
+            total_labor_cost = total_labor_cost + excluded.total_labor_cost,
+            last_refreshed = excluded.last_refreshed
+    """
+
     @staticmethod
     def initialize_manpower_tables():
         """
         OXIDE: Dissects the database to support employee records and daily labor logs.
         """
-        conn = MonkeyBrain.get_connection()
+        conn = MonkeyBrain.get_cached_connection()
         if not conn: return
 
         try:
-            cursor = conn.cursor()
-            # EMPLOYEE_ROSTER: The master list of field and shop staff
-            cursor.execute("""
-                CREATE TABLE IF NOT EXISTS employee_roster (
-                    emp_id TEXT PRIMARY KEY,
-                    full_name TEXT,
-                    trade_rank TEXT, -- Apprentice, Journeyman, Foreman
-                    hourly_rate REAL,
-                    certifications TEXT, -- JSON string of OSHA, Lift, etc.
-                    status TEXT DEFAULT 'ACTIVE'
-                )
-            """)
-
-            # LABOR_LOGS: Daily hour tracking per project
-            cursor.execute("""
-                CREATE TABLE IF NOT EXISTS labor_logs (
-                    log_id INTEGER PRIMARY KEY AUTOINCREMENT,
-                    project_id TEXT,
-                    emp_id TEXT,
-                    hours_worked REAL,
-                    work_date DATE,
-                    description TEXT,
-                    FOREIGN KEY(project_id) REFERENCES core_projects(project_id),
-                    FOREIGN KEY(emp_id) REFERENCES employee_roster(emp_id)
-                )
-            """)
-            conn.commit()
-            conn.close()
+            with conn:
+                cursor = conn.cursor()
+
+                # EMPLOYEE_ROSTER: The master list of field and shop staff
+                cursor.execute("""
+                    CREATE TABLE IF NOT EXISTS employee_roster (
+                        emp_id TEXT PRIMARY KEY,
+                        full_name TEXT,
+                        trade_rank TEXT, -- Apprentice, Journeyman, Foreman
+                        hourly_rate REAL,
+                        certifications TEXT, -- JSON string of OSHA, Lift, etc.
+                        status TEXT DEFAULT 'ACTIVE'
+                    )
+                """)
+
+                # LABOR_LOGS: Daily hour tracking per project
+                cursor.execute("""
+                    CREATE TABLE IF NOT EXISTS labor_logs (
+                        log_id INTEGER PRIMARY KEY AUTOINCREMENT,
+                        project_id TEXT,
+                        emp_id TEXT,
+                        hours_worked REAL,
+                        rate_at_log REAL, -- Hourly rate when the work was logged
+                        work_date DATE,
+                        description TEXT,
+                        FOREIGN KEY(project_id) REFERENCES core_projects(project_id),
+                        FOREIGN KEY(emp_id) REFERENCES employee_roster(emp_id)
+                    )
+                """)
+
+                # Older ledgers: add rate_at_log and backfill it from the current roster once
+                labor_cols = {row[1] for row in cursor.execute("PRAGMA table_info(labor_logs)")}
+                if "rate_at_log" not in labor_cols:
+                    cursor.execute("ALTER TABLE labor_logs ADD COLUMN rate_at_log REAL")
+                    cursor.execute("""
+                        UPDATE labor_logs SET rate_at_log =
+                            (SELECT hourly_rate FROM employee_roster e WHERE e.emp_id = labor_logs.emp_id)
+                    """)
+
+                # PROJECT_LABOR_COST_CACHE: Materialized labor spend per project for the dashboard pulse.
+                # A ledger that predates the cache gets it backfilled from its existing logs below.
+                cache_is_new = cursor.execute(
+                    "SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = 'project_labor_cost_cache'"
+                ).fetchone() is None
+                cursor.execute("""
+                    CREATE TABLE IF NOT EXISTS project_labor_cost_cache (
+                        project_id TEXT PRIMARY KEY,
+                        total_labor_cost REAL,
+                        last_refreshed TEXT
+                    )
+                """)
+
+                # INDEXES: Dashboard pulse seeks by project (and date range) instead of scanning every log
+                cursor.execute("CREATE INDEX IF NOT EXISTS idx_labor_logs_project_date ON labor_logs(project_id, work_date)")
+                cursor.execute("CREATE INDEX IF NOT EXISTS idx_labor_logs_emp ON labor_logs(emp_id)")
+                cursor.execute("CREATE INDEX IF NOT EXISTS idx_employee_status ON employee_roster(status)")
+
+            if cache_is_new:
+                RabbitManpower.refresh_cost_cache()
         except Exception as e:
             Bananas.report_collision(e, "MANPOWER_SCHEMA_CRASH")
 
     @staticmethod
-    def register_employee(name, rank, rate, certs="[]"):
+    def _execute(cmd, params, conn=None):
+        """Runs on the caller's shared connection (caller commits) or as a standalone oxide write."""
+        if conn is not None:
+            conn.execute(cmd, params)
+        else:
+            MonkeyBrain.execute_oxide(cmd, params)
+
+    @staticmethod
+    def register_employee(name, rank, rate, certs="[]", conn=None):
         """
         OXIDE: Injects a new field operative into the roster.
+        Pass `conn` to share one connection/transaction across a batch.
         """
         emp_id = f"EMP-{name[:3].upper()}-{datetime.now().strftime('%S%f')[:4]}"
         try:
@@ -62,38 +118,101 @@ class RabbitManpower:
                 INSERT INTO employee_roster (emp_id, full_name, trade_rank, hourly_rate, certifications)
                 VALUES (?, ?, ?, ?, ?)
             """
-            MonkeyBrain.execute_oxide(cmd, (emp_id, name, rank, rate, certs))
+            RabbitManpower._execute(cmd, (emp_id, name, rank, rate, certs), conn)
             return emp_id
         except Exception as e:
             Bananas.report_collision(e, "EMPLOYEE_REGISTRATION_FAILURE")
             return None
 
     @staticmethod
-    def log_daily_labor(project_id, emp_id, hours, desc=""):
+    def log_daily_labor(project_id, emp_id, hours, desc="", conn=None, now=None):
         """
         OXIDE: Records field production hours.
         Feeds directly into the 'Belly' for real-time cost tracking.
+        Pass `conn` to share one connection/transaction across a batch, and `now`
+        (a datetime read once by the caller) so a bulk loop doesn't hit the clock per row.
+        The log row and its cost-cache bump commit together, so the cache never drifts.
         """
+        row = (project_id, emp_id, hours, (now or datetime.now()).date(), desc)
         try:
-            cmd = """
-                INSERT INTO labor_logs (project_id, emp_id, hours_worked, work_date, description)
-                VALUES (?, ?, ?, ?, ?)
-            """
-            MonkeyBrain.execute_oxide(cmd, (project_id, emp_id, hours, datetime.now().date(), desc))
+            if conn is not None:
+                # Caller owns the transaction and commits
+                conn.execute(RabbitManpower.INSERT_LABOR_SQL, row)
+                conn.execute(RabbitManpower.COST_CACHE_BUMP_SQL, (project_id, hours, emp_id))
+            else:
+                own = MonkeyBrain.get_cached_connection()
+                own.execute("BEGIN IMMEDIATE")
+                try:
+                    own.execute(RabbitManpower.INSERT_LABOR_SQL, row)
+                    own.execute(RabbitManpower.COST_CACHE_BUMP_SQL, (project_id, hours, emp_id))
+                    own.commit()
+                except Exception:
+                    own.rollback()
+                    raise
 
             Bananas.notify("LABOR_SYNC", f"Logged {hours} hrs for {emp_id} on {project_id}")
         except Exception as e:
             Bananas.report_collision(e, "LABOR_LOGGING_FAILURE")
 
+    @staticmethod
+    def log_daily_labor_batch(entries):
+        """
+        OXIDE: End-of-shift bulk upload. Each entry is (project_id, emp_id, hours, desc).
+        All rows and their cost-cache bumps land in one transaction with one summary toast.
+        """
+        if not entries: return True
+
+        conn = MonkeyBrain.get_cached_connection()
+        if not conn: return False
+
+        work_date = datetime.now().date().isoformat()
+        rows = [(project_id, emp_id, hours, work_date, desc) for project_id, emp_id, hours, desc in entries]
+        bumps = [(project_id, hours, emp_id) for project_id, emp_id, hours, _desc in entries]
+
+        try:
+            conn.execute("BEGIN IMMEDIATE")
+            try:
+                conn.executemany(RabbitManpower.INSERT_LABOR_SQL, rows)
+                conn.executemany(RabbitManpower.COST_CACHE_BUMP_SQL, bumps)
+                conn.commit()
+            except Exception:
+                conn.rollback()
+                raise
+
+            total_hours = sum(row[2] for row in rows)
+            projects = ", ".join(dict.fromkeys(row[0] for row in rows))
+            Bananas.notify("LABOR_SYNC", f"Logged {total_hours} hrs across {len(rows)} entries on {projects}")
+            return True
+        except Exception as e:
+            Bananas.report_collision(e, "LABOR_LOGGING_FAILURE")
+            return False
+
+    @staticmethod
+    def refresh_cost_cache():
+        """
+        OXIDE: Rebuilds the materialized labor spend for every project from the raw logs.
+        Run after bulk corrections; daily logging keeps it current incrementally.
+        Single-table scan: each log already carries the rate it was paid at.
+        """
+        try:
+            cmd = """
+                INSERT OR REPLACE INTO project_labor_cost_cache (project_id, total_labor_cost, last_refreshed)
+                SELECT project_id, SUM(hours_worked * rate_at_log), datetime('now')
+                FROM labor_logs
+                GROUP BY project_id
+            """
+            MonkeyBrain.execute_oxide(cmd, ())
+        except Exception as e:
+            Bananas.report_collision(e, "LABOR_CACHE_REFRESH_FAILURE")
+
     @staticmethod
     def get_project_manpower_pulse(project_id):
         """
         Retrieves total labor spend vs. estimates for the Executive Dashboard.
+        Reads the materialized cost row (one primary-key seek) instead of re-joining the logs.
         """
         query = """
-            SELECT SUM(l.hours_worked * e.hourly_rate) as total_labor_cost
-            FROM labor_logs l
-            JOIN employee_roster e ON l.emp_id = e.emp_id
-            WHERE l.project_id = ?
+            SELECT (SELECT total_labor_cost FROM project_labor_cost_cache WHERE project_id = ?)
+                   as total_labor_cost
         """
         return MonkeyBrain.query_oxide(query, (project_id,))
\ No newline at end of file
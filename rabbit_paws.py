@@ -24,7 +24,7 @@ INTEGRATIONS:
 """
 
 import time
-import uuid
+import secrets
 from datetime import datetime
 from typing import List, Dict, Optional, Any
 
@@ -51,8 +51,8 @@ try:
 except ImportError:
     class MonkeyHeart:
         @staticmethod
-        def log_financial_event(job_id, amount, description, user):
-            print(f"💰 [AUDIT] {job_id}: ${amount} - {description}")
+        def log_financial_event(job_id, amount, description, user, *args):
+            print(f"💰 [AUDIT] {job_id}: ${amount} - {description % args if args else description}")
 
         @staticmethod
         def log_system_event(event_type, message):
@@ -84,17 +84,20 @@ class RabbitPaws:
     """
 
     def __init__(self):
-        self.reqs = MOCK_REQS
-        self.purchase_orders = []
+        # Keyed by id (dicts keep insertion order, so iteration still runs oldest-first)
+        self.reqs: Dict[str, Dict] = {r['id']: r for r in MOCK_REQS}
+        self.purchase_orders: Dict[str, Dict] = {}
 
     # ==========================================================================
     # 🤲 REQUISITION (The Ask)
     # ==========================================================================
 
-    def create_requisition(self, job_id: str, requester: str, items: List[Dict]) -> Dict[str, Any]:
+    def create_requisition(self, job_id: str, requester: str, items: List[Dict],
+                           now: Optional[datetime] = None) -> Dict[str, Any]:
         """
         Field creates a wishlist.
         Items format: [{'sku': 'X', 'qty': 10, 'est_cost': 5.00}]
+        `now` lets a bulk caller stamp every record from one clock read.
         """
         total = sum(i['est_cost'] for i in items)
 
@@ -106,10 +109,10 @@ class RabbitPaws:
             "items": items,
             "status": "PENDING_APPROVAL",
             "total_cost": round(total, 2),
-            "created_at": datetime.now().isoformat()
+            "created_at": (now or datetime.now()).isoformat()
         }
 
-        self.reqs.append(new_req)
+        self.reqs[req_id] = new_req
 
         MonkeyHeart.log_system_event("PURCHASE_REQ", f"{requester} requested ${total} for {job_id}")
         Bananas.notify("New Request", f"{requester} needs materials for {job_id}.")
@@ -120,11 +123,13 @@ class RabbitPaws:
     # 🚦 APPROVAL (The Gatekeeper)
     # ==========================================================================
 
-    def approve_requisition(self, req_id: str, approver: str, budget_limit: float) -> Dict[str, Any]:
+    def approve_requisition(self, req_id: str, approver: str, budget_limit: float,
+                            now: Optional[datetime] = None) -> Dict[str, Any]:
         """
         PM reviews and converts to PO.
+        `now` lets a bulk caller stamp every record from one clock read.
         """
-        req = next((r for r in self.reqs if r['id'] == req_id), None)
+        req = self.reqs.get(req_id)
         if not req: return {"success": False, "reason": "Req Not Found"}
 
         # 1. Budget Check (The Leash)
@@ -134,7 +139,7 @@ class RabbitPaws:
 
         # 2. Convert to PO
         req['status'] = "APPROVED"
-        po_number = f"PO-{req['job_id'].replace('JOB-', '')}-{uuid.uuid4().hex[:4].upper()}"
+        po_number = f"PO-{req['job_id'].replace('JOB-', '')}-{secrets.token_hex(2).upper()}"
 
         po_record = {
             "po_number": po_number,
@@ -142,13 +147,13 @@ class RabbitPaws:
             "vendor": "PREFERRED_VENDOR",  # Logic to pick vendor would be here
             "total": req['total_cost'],
             "issued_by": approver,
-            "issued_at": datetime.now().isoformat(),
+            "issued_at": (now or datetime.now()).isoformat(),
             "status": "ISSUED"
         }
 
-        self.purchase_orders.append(po_record)
+        self.purchase_orders[po_number] = po_record
 
-        MonkeyHeart.log_financial_event(req['job_id'], req['total_cost'], f"PO {po_number} Issued", approver)
+        MonkeyHeart.log_financial_event(req['job_id'], req['total_cost'], "PO %s Issued", approver, po_number)
 
         return {
             "success": True,
@@ -161,7 +166,7 @@ class RabbitPaws:
     # ==========================================================================
 
     def check_status(self, req_id: str) -> str:
-        req = next((r for r in self.reqs if r['id'] == req_id), None)
+        req = self.reqs.get(req_id)
         if req:
             return req['status']
         return "UNKNOWN"
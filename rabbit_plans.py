@@ -19,15 +19,19 @@ CORE CAPABILITIES:
 INTEGRATIONS:
 - Bananas (Error Handling)
 - Monkey Brain (Metadata Storage)
+- SQLite 'redlines' table (Annotations)
 """
 
+import io
 import os
+import asyncio
+import re
 import json
 import hashlib
 import shutil
-import time
+import sqlite3
 from datetime import datetime
-from typing import List, Dict, Optional, Any
+from typing import List, Dict, Optional, Any, BinaryIO, Tuple, Union
 
 # ==============================================================================
 # 🍌 IMPORT BANANAS (The Shield)
@@ -69,36 +73,68 @@ class RabbitPlans:
     """
 
     STORAGE_DIR = "plan_vault"
+    MANIFEST_NAME = "version_manifest.json"
+    HASH_ALGO = "sha256"
+    CHUNK_SIZE = 1024 * 1024  # Streamed uploads are hashed + written 1MB at a time
+    DEVICE_DIR = "device_cache"  # Offline copy of plan sets on the field device
+    SYNC_CONCURRENCY = 8  # Sheets copied at once during an offline sync
+    REDLINE_DB = "redlines.db"
+    REDLINE_INSERT_SQL = """
+        INSERT INTO redlines (job_id, sheet_name, user, x, y, text, created_at)
+        VALUES (?, ?, ?, ?, ?, ?, ?)
+    """
+    _VERSIONED_PDF = re.compile(r"^(?P<base>.+)_v(?P<num>\d+)\.pdf$")
 
-    def __init__(self):
+    def __init__(self, conn: Optional[sqlite3.Connection] = None):
         self._setup_vault()
+        # Job folders known to exist: hot jobs skip the stat/makedirs round trip (slow on SMB vaults)
+        self._dir_cache: set = set()
+        # Redlines live in one indexed table: per-sheet fetches and job-wide rollups are seeks
+        self._conn = conn if conn is not None else sqlite3.connect(os.path.join(self.STORAGE_DIR, self.REDLINE_DB))
+        self._init_redline_table()
+        self._migrated_jobs = set()
 
     def _setup_vault(self):
         """Ensures the plan storage directory exists."""
-        if not os.path.exists(self.STORAGE_DIR):
-            os.makedirs(self.STORAGE_DIR)
+        os.makedirs(self.STORAGE_DIR, exist_ok=True)
+
+    def _ensure_job_dir(self, job_dir: str):
+        """Creates the job folder once per session; later calls are a set lookup."""
+        if job_dir not in self._dir_cache:
+            os.makedirs(job_dir, exist_ok=True)
+            self._dir_cache.add(job_dir)
+
+    def _job_dir_exists(self, job_dir: str) -> bool:
+        """Existence probe that only stats a job folder until it has been seen once."""
+        if job_dir in self._dir_cache:
+            return True
+        if os.path.isdir(job_dir):
+            self._dir_cache.add(job_dir)
+            return True
+        return False
 
     # ==========================================================================
     # 📤 PLAN INGESTION (The Upload)
     # ==========================================================================
 
-    def upload_plan_sheet(self, job_id: str, file_name: str, file_bytes: bytes, uploader: str) -> Dict[str, Any]:
+    def upload_plan_sheet(self, job_id: str, file_name: str, file_bytes: Union[bytes, BinaryIO],
+                          uploader: str, now: Optional[datetime] = None) -> Dict[str, Any]:
         """
         Saves a new plan sheet. Checks for revisions automatically.
 
         ARGS:
             job_id: "JOB-26001"
             file_name: "E-101.pdf"
-            file_bytes: The raw file data.
+            file_bytes: The raw file data, or a binary file object (streamed, never fully in memory).
             uploader: User ID.
+            now: Optional shared timestamp for bulk plan-set imports (one clock read per batch).
 
         RETURNS:
             dict: Metadata about the saved file.
         """
         MonkeyHeart.log_system_event("PLANS", f"Receiving upload: {file_name} for {job_id}")
 
-        # 1. Calculate Hash (Digital Fingerprint)
-        file_hash = hashlib.md5(file_bytes).hexdigest()
+        # 1. Hash (Digital Fingerprint) is computed while the file is written, in one pass
 
         # 2. Determine Version
         # In a real DB, we check if E-101 exists for this Job.
@@ -106,34 +142,41 @@ class RabbitPlans:
         # We save as plan_vault/JOB-26001/E-101_v1.pdf
 
         job_dir = os.path.join(self.STORAGE_DIR, job_id)
-        if not os.path.exists(job_dir):
-            os.makedirs(job_dir)
-
-        # Check for existing versions
-        existing_files = [f for f in os.listdir(job_dir) if f.startswith(file_name.replace(".pdf", ""))]
-        version_num = len(existing_files) + 1
+        self._ensure_job_dir(job_dir)
 
-        # 3. Save File
-        save_name = f"{file_name.replace('.pdf', '')}_v{version_num}.pdf"
-        full_path = os.path.join(job_dir, save_name)
+        # Next version comes from the job's manifest (re-read each upload: other sessions write it too)
+        base_name = file_name.replace(".pdf", "")
+        manifest = self._get_manifest(job_id, job_dir)
+        version_num = manifest.get(base_name, 0) + 1
 
         try:
-            with open(full_path, "wb") as f:
-                f.write(file_bytes)
+            # 3. Save File - exclusive create, so a version another session just wrote is never overwritten
+            while True:
+                save_name = f"{base_name}_v{version_num}.pdf"
+                full_path = os.path.join(job_dir, save_name)
+                try:
+                    file_hash, size = self._write_and_hash(file_bytes, full_path)
+                    break
+                except FileExistsError:
+                    version_num += 1
+
+            manifest = self._get_manifest(job_id, job_dir)
+            manifest[base_name] = max(manifest.get(base_name, 0), version_num)
+            self._save_manifest(job_dir, manifest)
 
             status_msg = f"Uploaded Version {version_num}"
             if version_num > 1:
                 status_msg += " (REVISION DETECTED)"
                 Bananas.notify("Revision Alert", f"New version of {file_name} detected!")
 
-            MonkeyHeart.log_system_event("PLANS_SAVE", f"Saved {save_name} ({len(file_bytes)} bytes)")
+            MonkeyHeart.log_system_event("PLANS_SAVE", f"Saved {save_name} ({size} bytes)")
 
             return {
                 "success": True,
                 "file_path": full_path,
                 "version": version_num,
                 "hash": file_hash,
-                "timestamp": datetime.now().isoformat(),
+                "timestamp": (now or datetime.now()).isoformat(),
                 "status": status_msg
             }
 
@@ -141,46 +184,112 @@ class RabbitPlans:
             Bananas.report_collision(e, "Plan Upload")
             return {"success": False, "error": str(e)}
 
+    def _write_and_hash(self, source: Union[bytes, BinaryIO], path: str) -> Tuple[str, int]:
+        """
+        Writes the upload to disk and fingerprints it in the same pass.
+        File objects are streamed in CHUNK_SIZE blocks, so memory stays flat on huge plan sets.
+        Raises FileExistsError (before reading the source) if `path` is already taken.
+        A failed write removes the partial file, so it never claims the version number.
+        """
+        hasher = hashlib.new(self.HASH_ALGO)
+        size = 0
+        with open(path, "xb") as out:
+            try:
+                if isinstance(source, (bytes, bytearray, memoryview)):
+                    hasher.update(source)
+                    out.write(source)
+                    size = len(source)
+                else:
+                    while True:
+                        chunk = source.read(self.CHUNK_SIZE)
+                        if not chunk:
+                            break
+                        hasher.update(chunk)
+                        out.write(chunk)
+                        size += len(chunk)
+            except BaseException:
+                out.close()
+                os.unlink(path)
+                raise
+        return hasher.hexdigest(), size
+
+    def _get_manifest(self, job_id: str, job_dir: str) -> Dict[str, int]:
+        """
+        Loads the job's base_name -> version manifest (one small JSON read).
+        Jobs uploaded before the manifest existed are indexed by one directory scan.
+        """
+        path = os.path.join(job_dir, self.MANIFEST_NAME)
+        try:
+            with open(path, "r") as f:
+                manifest = json.load(f)
+        except FileNotFoundError:
+            manifest = {}
+            for name in os.listdir(job_dir):
+                match = self._VERSIONED_PDF.match(name)
+                if match:
+                    base, num = match.group("base"), int(match.group("num"))
+                    manifest[base] = max(manifest.get(base, 0), num)
+
+        return manifest
+
+    def _save_manifest(self, job_dir: str, manifest: Dict[str, int]):
+        """Writes the manifest via a temp file so a crash never leaves it half-written."""
+        path = os.path.join(job_dir, self.MANIFEST_NAME)
+        tmp_path = path + ".tmp"
+        with open(tmp_path, "w") as f:
+            json.dump(manifest, f)
+        os.replace(tmp_path, path)
+
     # ==========================================================================
     # 🖍️ REDLINING (The Annotations)
     # ==========================================================================
 
     def add_redline(self, job_id: str, sheet_name: str, user: str,
-                    x_coord: float, y_coord: float, note: str) -> bool:
+                    x_coord: float, y_coord: float, note: str, now: Optional[datetime] = None) -> bool:
         """
         Saves a digital sticky note on a drawing.
 
         ARGS:
             x_coord/y_coord: Percentage (0.0 to 1.0) relative to sheet size.
+            now: Optional shared timestamp when called from a bulk loop.
         """
-        # In V7.0, we store these in a JSON sidecar file next to the plan
+        # In V7.0, notes live in the indexed 'redlines' table (one INSERT per note)
         job_dir = os.path.join(self.STORAGE_DIR, job_id)
-        if not os.path.exists(job_dir):
+        if not self._job_dir_exists(job_dir):
             return False
 
-        sidecar_path = os.path.join(job_dir, f"{sheet_name}_redlines.json")
+        try:
+            self._migrate_sidecars(job_id)
+            with self._conn:
+                self._conn.execute(self.REDLINE_INSERT_SQL,
+                                   (job_id, sheet_name, user, x_coord, y_coord, note, (now or datetime.now()).isoformat()))
 
-        entry = {
-            "id": f"NOTE-{int(time.time())}",
-            "user": user,
-            "x": x_coord,
-            "y": y_coord,
-            "text": note,
-            "date": datetime.now().isoformat()
-        }
+            MonkeyHeart.log_system_event("PLANS_NOTE", f"Redline added to {sheet_name}: '{note}'")
+            return True
 
-        try:
-            data = []
-            if os.path.exists(sidecar_path):
-                with open(sidecar_path, "r") as f:
-                    data = json.load(f)
+        except Exception as e:
+            Bananas.report_collision(e, "Add Redline")
+            return False
 
-            data.append(entry)
+    def add_redlines_bulk(self, job_id: str, sheet_name: str, notes: List[Dict]) -> bool:
+        """
+        Saves a batch of notes in one transaction (e.g. a markup session synced from the tablet).
+        Each note: {'user': ..., 'x': ..., 'y': ..., 'text': ...}
+        """
+        job_dir = os.path.join(self.STORAGE_DIR, job_id)
+        if not self._job_dir_exists(job_dir):
+            return False
+        if not notes:
+            return True
 
-            with open(sidecar_path, "w") as f:
-                json.dump(data, f, indent=2)
+        now = datetime.now().isoformat()
+        rows = [(job_id, sheet_name, n['user'], n['x'], n['y'], n['text'], now) for n in notes]
+        try:
+            self._migrate_sidecars(job_id)
+            with self._conn:
+                self._conn.executemany(self.REDLINE_INSERT_SQL, rows)
 
-            MonkeyHeart.log_system_event("PLANS_NOTE", f"Redline added to {sheet_name}: '{note}'")
+            MonkeyHeart.log_system_event("PLANS_NOTE", f"{len(rows)} redlines added to {sheet_name}")
             return True
 
         except Exception as e:
@@ -189,29 +298,120 @@ class RabbitPlans:
 
     def get_redlines(self, job_id: str, sheet_name: str) -> List[Dict]:
         """Retrieves all notes for a sheet."""
-        job_dir = os.path.join(self.STORAGE_DIR, job_id)
-        sidecar_path = os.path.join(job_dir, f"{sheet_name}_redlines.json")
+        self._migrate_sidecars(job_id)
+        cursor = self._conn.execute(
+            "SELECT id, user, x, y, text, created_at FROM redlines WHERE job_id = ? AND sheet_name = ? ORDER BY id",
+            (job_id, sheet_name))
+        return [{"id": f"NOTE-{row[0]}", "user": row[1], "x": row[2], "y": row[3], "text": row[4], "date": row[5]}
+                for row in cursor]
+
+    def get_job_redlines(self, job_id: str) -> List[Dict]:
+        """Every note across every sheet of a job (index range scan on job_id)."""
+        self._migrate_sidecars(job_id)
+        cursor = self._conn.execute(
+            "SELECT id, sheet_name, user, x, y, text, created_at FROM redlines WHERE job_id = ? ORDER BY sheet_name, id",
+            (job_id,))
+        return [{"id": f"NOTE-{row[0]}", "sheet": row[1], "user": row[2], "x": row[3], "y": row[4],
+                 "text": row[5], "date": row[6]} for row in cursor]
+
+    def _init_redline_table(self):
+        """Creates the redlines table and its (job, sheet) index."""
+        with self._conn:
+            self._conn.execute("""
+                CREATE TABLE IF NOT EXISTS redlines (
+                    id INTEGER PRIMARY KEY AUTOINCREMENT,
+                    job_id TEXT NOT NULL,
+                    sheet_name TEXT NOT NULL,
+                    user TEXT,
+                    x REAL,
+                    y REAL,
+                    text TEXT,
+                    created_at TEXT
+                )
+            """)
+            self._conn.execute("CREATE INDEX IF NOT EXISTS idx_redlines_job_sheet ON redlines(job_id, sheet_name)")
+
+    def _migrate_sidecars(self, job_id: str):
+        """
+        One-time import of pre-table sidecars ({sheet}_redlines.json / .jsonl) for a job.
+        Imported files are renamed *.migrated so they are never loaded twice.
+        """
+        if job_id in self._migrated_jobs:
+            return
+        self._migrated_jobs.add(job_id)
 
-        if os.path.exists(sidecar_path):
-            with open(sidecar_path, "r") as f:
-                return json.load(f)
-        return []
+        job_dir = os.path.join(self.STORAGE_DIR, job_id)
+        try:
+            names = os.listdir(job_dir)
+        except FileNotFoundError:
+            return
+
+        for name in names:
+            if name.endswith("_redlines.json"):
+                sheet_name = name[:-len("_redlines.json")]
+            elif name.endswith("_redlines.jsonl"):
+                sheet_name = name[:-len("_redlines.jsonl")]
+            else:
+                continue
+
+            path = os.path.join(job_dir, name)
+            with open(path, "r") as f:
+                if name.endswith(".jsonl"):
+                    notes = [json.loads(line) for line in f if line.strip()]
+                else:
+                    notes = json.load(f)
+
+            rows = [(job_id, sheet_name, n.get('user'), n.get('x'), n.get('y'), n.get('text'), n.get('date'))
+                    for n in notes]
+            with self._conn:
+                self._conn.executemany(self.REDLINE_INSERT_SQL, rows)
+            os.replace(path, path + ".migrated")
 
     # ==========================================================================
     # 💾 OFFLINE SYNC (The Cache)
     # ==========================================================================
 
-    def sync_to_device(self, job_id: str):
+    def sync_to_device(self, job_id: str, device_dir: Optional[str] = None) -> bool:
         """
-        Simulates downloading the entire Plan Set for a job to local storage.
+        Copies the current Plan Set for a job to local storage.
         Used when the Foreman clicks "Make Available Offline."
+        Blocking wrapper; async callers (the API bridge) should await sync_to_device_async.
+        """
+        return asyncio.run(self.sync_to_device_async(job_id, device_dir))
+
+    async def sync_to_device_async(self, job_id: str, device_dir: Optional[str] = None) -> bool:
+        """
+        Copies the latest version of every sheet concurrently (capped at SYNC_CONCURRENCY),
+        so the set finishes in about the time of its slowest sheet instead of the sum of all.
         """
         MonkeyHeart.log_system_event("PLANS_SYNC", f"Caching Plan Set for {job_id}...")
-        time.sleep(1.5)  # Simulate download time
 
-        # In a real app, this would verify file integrity.
-        # Here we just confirm success.
-        Bananas.notify("Sync Complete", f"Plans for {job_id} are ready offline.")
+        job_dir = os.path.join(self.STORAGE_DIR, job_id)
+        if not self._job_dir_exists(job_dir):
+            Bananas.notify("Sync Failed", f"No plans on file for {job_id}.")
+            return False
+
+        target_dir = os.path.join(device_dir or self.DEVICE_DIR, job_id)
+        os.makedirs(target_dir, exist_ok=True)
+
+        # Offline only needs the current revision of each sheet
+        manifest = self._get_manifest(job_id, job_dir)
+        sheets = [f"{base}_v{version}.pdf" for base, version in manifest.items()]
+
+        gate = asyncio.Semaphore(self.SYNC_CONCURRENCY)
+
+        async def _copy(name: str):
+            async with gate:
+                # shutil.copyfile uses the kernel's zero-copy path (sendfile) where available
+                await asyncio.to_thread(shutil.copyfile, os.path.join(job_dir, name), os.path.join(target_dir, name))
+
+        try:
+            await asyncio.gather(*(_copy(name) for name in sheets))
+        except Exception as e:
+            Bananas.report_collision(e, "Plan Sync")
+            return False
+
+        Bananas.notify("Sync Complete", f"Plans for {job_id} are ready offline ({len(sheets)} sheets).")
         return True
 
 
@@ -235,6 +435,11 @@ if __name__ == "__main__":
     res2 = vault.upload_plan_sheet("JOB-TEST", "E-101.pdf", dummy_pdf, "Justin")
     print(f" > {res2['status']} ({res2['file_path']})")
 
+    # 3b. Test Streamed Upload (file object instead of bytes)
+    print("\n[TEST 2b] Streaming 'E-101.pdf' (v3) from a file object...")
+    res3 = vault.upload_plan_sheet("JOB-TEST", "E-101.pdf", io.BytesIO(dummy_pdf), "Justin")
+    print(f" > {res3['status']} | Same Fingerprint: {res3['hash'] == res2['hash']}")
+
     # 4. Test Redlining
     print("\n[TEST 3] Adding Redline to E-101...")
     vault.add_redline("JOB-TEST", "E-101", "Foreman", 0.5, 0.5, "RFI Needed Here")
@@ -244,5 +449,9 @@ if __name__ == "__main__":
     print(f" > Found {len(notes)} Redlines.")
     print(f" > Note 1: '{notes[0]['text']}' at {notes[0]['x']},{notes[0]['y']}")
 
+    # 6. Offline Sync
+    print("\n[TEST 4] Making JOB-TEST available offline...")
+    print(f" > Synced: {vault.sync_to_device('JOB-TEST')}")
+
     print("\n" + "=" * 40)
     print("🐰 RABBIT PLANS SYSTEM: OPERATIONAL")
\ No newline at end of file
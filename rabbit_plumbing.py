@@ -1,7 +1,34 @@
 import math
+from types import MappingProxyType
 from monkey_heart import MonkeyHeart
 from bananas import Bananas
 
+# NumPy is optional: big fixture schedules get a vectorized gather + sum when it is present
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+# Lookup tables are built once at import (read-only views), not re-allocated per call
+
+# IPC Table E103.3 water supply fixture units (WSFU)
+_WSFU_TABLE = MappingProxyType({
+    "TOILET_PUBLIC": 10.0,
+    "SINK_KITCHEN": 1.5,
+    "SHOWER": 2.0,
+    "LAVATORY": 1.0
+})
+# Fixture code -> row, and the weights as one vector for a gather + reduce
+_FIX_CODES = {k: i for i, k in enumerate(_WSFU_TABLE)}
+_FIX_WEIGHTS = np.array(list(_WSFU_TABLE.values()), dtype=np.float64) if np is not None else None
+
+# Regional labor units, Ohio Plumbing/Mechanical
+_LABOR_UNITS = MappingProxyType({
+    "PVC_DWV_4_INCH": 0.08,  # Hours per foot
+    "COPPER_L_TYPE_3/4": 0.12,  # Hours per foot
+    "WATER_HEATER_50GAL": 4.0,  # Hours per unit
+})
+
 
 class RabbitPlumbing:
     """
@@ -39,15 +66,19 @@ class RabbitPlumbing:
         OXIDE: Total Water Supply Fixture Units (WSFU).
         Dissects IPC Table E103.3.
         """
-        # Multiplier logic for 50k line expansion
-        values = {
-            "TOILET_PUBLIC": 10.0,
-            "SINK_KITCHEN": 1.5,
-            "SHOWER": 2.0,
-            "LAVATORY": 1.0
-        }
-
-        total_units = sum([values.get(f.upper(), 0) for f in fixtures])
+        # Multiplier logic for 50k line expansion: codes once, then one vector gather + sum
+        if np is None:
+            table = _WSFU_TABLE
+            total_units = float(sum(
+                table[f] if f in table else table.get(f.upper(), 0.0) for f in fixtures
+            ))
+        else:
+            codes = _FIX_CODES
+            idx = np.fromiter(
+                (codes[f] if f in codes else codes.get(f.upper(), -1) for f in fixtures),
+                dtype=np.intp
+            )
+            total_units = float(_FIX_WEIGHTS[idx[idx >= 0]].sum())
 
         return {
             "total_wsfu": total_units,
@@ -61,9 +92,4 @@ class RabbitPlumbing:
         Provides regional labor units for Ohio Plumbing/Mechanical markets.
         Crucial for the 'Immediate Buy-In' when bidding against rivals.
         """
-        units = {
-            "PVC_DWV_4_INCH": 0.08,  # Hours per foot
-            "COPPER_L_TYPE_3/4": 0.12,  # Hours per foot
-            "WATER_HEATER_50GAL": 4.0,  # Hours per unit
-        }
-        return units.get(item_category, 0.0)
\ No newline at end of file
+        return _LABOR_UNITS.get(item_category, 0.0)
\ No newline at end of file
@@ -23,12 +23,19 @@ INTEGRATIONS:
 - Raptor Vendor (External API)
 """
 
-import uuid
+import secrets
 import time
 import json
+from collections import defaultdict
 from datetime import datetime
 from typing import List, Dict, Optional, Any
 
+# NumPy is optional: very long POs get a vectorized total when it is present
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
 # ==============================================================================
 # 🍌 IMPORT BANANAS (The Shield)
 # ==============================================================================
@@ -56,8 +63,8 @@ except ImportError:
             print(f"❤️ [HEARTBEAT] [{event_type}] {message}")
 
         @staticmethod
-        def log_financial_event(job_id, amount, description, user):
-            print(f"💰 [AUDIT] {job_id}: ${amount} - {description}")
+        def log_financial_event(job_id, amount, description, user, *args):
+            print(f"💰 [AUDIT] {job_id}: ${amount} - {description % args if args else description}")
 
 # ==============================================================================
 # 🧾 MOCK PO DATABASE
@@ -86,8 +93,17 @@ class RabbitPO:
     """
 
     def __init__(self):
-        self.orders = MOCK_POS
+        # Keyed by PO number (dicts keep insertion order, so iteration still runs oldest-first)
+        self.orders: Dict[str, Dict] = {p['po_number']: p for p in MOCK_POS}
+        # Per-job PO counters, seeded from the numbers already issued
+        self._po_seq_by_job: Dict[str, int] = defaultdict(int)
+        for p in self.orders.values():
+            suffix = p['po_number'].rsplit('-', 1)[-1]
+            if suffix.isdigit():
+                job_id = p['job_id']
+                self._po_seq_by_job[job_id] = max(self._po_seq_by_job[job_id], int(suffix))
         self.approval_limit = 1000.00  # $1k limit before Manager approval needed
+        self.vector_threshold = 1000  # Line count where the NumPy total beats the generator
 
     # ==========================================================================
     # 📝 RFQ CREATION (The Ask)
@@ -100,7 +116,7 @@ class RabbitPO:
         ARGS:
             items: [{'description': '400A Fuse', 'qty': 3}]
         """
-        rfq_id = f"RFQ-{uuid.uuid4().hex[:6].upper()}"
+        rfq_id = f"RFQ-{secrets.token_hex(3).upper()}"
 
         MonkeyHeart.log_system_event("PO_RFQ", f"New RFQ {rfq_id} from {requester} for {job_id}")
 
@@ -115,15 +131,19 @@ class RabbitPO:
     # 💳 PO GENERATION (The Buy)
     # ==========================================================================
 
-    def generate_po(self, job_id: str, vendor: str, line_items: List[Dict], user: str) -> Dict[str, Any]:
+    def generate_po(self, job_id: str, vendor: str, line_items: List[Dict], user: str,
+                    now: Optional[datetime] = None) -> Dict[str, Any]:
         """
         Converts a list of items into a formal Purchase Order.
         Checks for approval limits.
+        `now` lets a bulk caller stamp every PO from one clock read.
         """
         # Calculate Total
-        total_cost = sum([item['qty'] * item['price'] for item in line_items])
+        total_cost = self._po_total(line_items)
 
-        po_number = f"PO-{job_id.replace('JOB-', '')}-{len(self.orders) + 1:03d}"
+        # Next number in this job's sequence (a DB backend would use an AUTOINCREMENT column, not COUNT(*))
+        self._po_seq_by_job[job_id] += 1
+        po_number = f"PO-{job_id.replace('JOB-', '')}-{self._po_seq_by_job[job_id]:03d}"
 
         status = "APPROVED"
         if total_cost > self.approval_limit:
@@ -138,10 +158,10 @@ class RabbitPO:
             "total": total_cost,
             "created_by": user,
             "items": line_items,
-            "date": datetime.now().isoformat()
+            "date": (now or datetime.now()).isoformat()
         }
 
-        self.orders.append(new_po)
+        self.orders[po_number] = new_po
 
         if status == "APPROVED":
             self._finalize_po(new_po, user)
@@ -153,7 +173,7 @@ class RabbitPO:
         """
         Manager (Lion) approves a large purchase.
         """
-        po = next((p for p in self.orders if p['po_number'] == po_number), None)
+        po = self.orders.get(po_number)
         if po and po['status'] == "PENDING_APPROVAL":
             po['status'] = "APPROVED"
             MonkeyHeart.log_system_event("PO_APPROVE", f"{po_number} approved by {approver}")
@@ -161,12 +181,21 @@ class RabbitPO:
             return True
         return False
 
+    def _po_total(self, line_items: List[Dict]) -> float:
+        """Sum of qty x price. Generator for normal POs; one vector dot product for huge ones."""
+        n = len(line_items)
+        if np is not None and n >= self.vector_threshold:
+            qty = np.fromiter((item['qty'] for item in line_items), dtype=np.float64, count=n)
+            price = np.fromiter((item['price'] for item in line_items), dtype=np.float64, count=n)
+            return float(qty @ price)
+        return sum(item['qty'] * item['price'] for item in line_items)
+
     def _finalize_po(self, po: Dict, user: str):
         """
         Sends to vendor and logs financial hit.
         """
         # 1. Log the Money
-        MonkeyHeart.log_financial_event(po['job_id'], po['total'], f"PO Issued to {po['vendor']}", user)
+        MonkeyHeart.log_financial_event(po['job_id'], po['total'], "PO Issued to %s", user, po['vendor'])
 
         # 2. Trigger Vendor API (Mock)
         # In V7.0, we assume 'raptor_vendor' handles the transmission
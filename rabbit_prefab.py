@@ -24,10 +24,16 @@ INTEGRATIONS:
 """
 
 import uuid
-import time
+from collections import Counter, defaultdict, deque
 from datetime import datetime
 from typing import List, Dict, Optional, Any
 
+# NumPy is optional: BOM explosions become one vector multiply when it is present
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
 # ==============================================================================
 # 🍌 IMPORT BANANAS (The Shield)
 # ==============================================================================
@@ -81,13 +87,19 @@ BOM_CATALOG = {
 # 🏭 THE KANBAN BOARD (Production State)
 # ==============================================================================
 
+STATUS_QUEUED = "QUEUED"
+STATUS_BUILDING = "BUILDING"
+STATUS_QC_CHECK = "QC_CHECK"
+STATUS_READY = "READY"
+BOARD_COLUMNS = (STATUS_QUEUED, STATUS_BUILDING, STATUS_QC_CHECK, STATUS_READY)
+
 MOCK_KANBAN = [
     {
         "ticket_id": "PF-1001",
         "job_id": "JOB-26001",
         "kit_type": "KIT-OFFICE-ROUGH",
         "qty": 50,
-        "status": "QUEUED",  # QUEUED, BUILDING, QC_CHECK, READY
+        "status": STATUS_QUEUED,  # QUEUED, BUILDING, QC_CHECK, READY
         "assigned_to": None,
         "due_date": "2026-01-25"
     },
@@ -96,7 +108,7 @@ MOCK_KANBAN = [
         "job_id": "JOB-26002",
         "kit_type": "KIT-HOSPITAL-GRD",
         "qty": 20,
-        "status": "BUILDING",
+        "status": STATUS_BUILDING,
         "assigned_to": "Apprentice Joe",
         "due_date": "2026-01-22"
     }
@@ -112,9 +124,68 @@ class RabbitPrefab:
     The Factory Boss.
     """
 
+    # Deepest kit-of-kits nesting explored before a recipe is treated as circular
+    MAX_BOM_DEPTH = 16
+
+    # Printed text block on the kit label; filled straight from the card
+    LABEL_TEXT = "{job_id}\n{kit_type}\nQTY: {qty}"
+
     def __init__(self):
         self.recipes = BOM_CATALOG
-        self.board = MOCK_KANBAN
+        self.board = [dict(c) for c in MOCK_KANBAN]  # Own records: moves never touch the module mock
+        self._compile_boms()
+        self._index_board()
+
+    def _compile_boms(self):
+        """Splits each recipe into a SKU tuple + base-qty column (SoA). Call after editing recipes."""
+        self._bom_skus = {kit: tuple(p['sku'] for p in r['parts']) for kit, r in self.recipes.items()}
+        if np is not None:
+            self._bom_qty = {kit: np.asarray([p['qty'] for p in r['parts']], dtype=np.int64)
+                             for kit, r in self.recipes.items()}
+        else:
+            self._bom_qty = {kit: tuple(p['qty'] for p in r['parts']) for kit, r in self.recipes.items()}
+        # Recipes that list another kit as a part (need the multi-level explode)
+        self._nested_kits = {kit for kit, skus in self._bom_skus.items() if any(s in self.recipes for s in skus)}
+        self._compile_rollup()
+
+    def _compile_rollup(self):
+        """
+        Per-unit raw-part rollup of every kit (nested kits already flattened).
+        With NumPy it is also packed CSR-style: one row per (kit, raw part), kit rows
+        starting at _kit_offsets[kit_idx], SKUs as indexes into _sku_names.
+        """
+        self._bom_flat = {}
+        for kit in self.recipes:
+            if kit in self._nested_kits:
+                rollup = self._explode_bfs(kit, 1)
+                self._bom_flat[kit] = (tuple(rollup.keys()), tuple(rollup.values()))
+            else:
+                self._bom_flat[kit] = (self._bom_skus[kit], tuple(int(q) for q in self._bom_qty[kit]))
+
+        if np is None:
+            return
+
+        self._kit_vocab = {kit: i for i, kit in enumerate(self._bom_flat)}
+        sku_vocab = {}
+        sku_idx, qty, offsets = [], [], [0]
+        for skus, qtys in self._bom_flat.values():
+            sku_idx.extend(sku_vocab.setdefault(s, len(sku_vocab)) for s in skus)
+            qty.extend(qtys)
+            offsets.append(len(sku_idx))
+
+        self._sku_names = tuple(sku_vocab)
+        self._parts_sku_idx = np.asarray(sku_idx, dtype=np.int32)
+        self._parts_qty = np.asarray(qty, dtype=np.int64)
+        self._kit_offsets = np.asarray(offsets, dtype=np.intp)
+        self._kit_nparts = np.diff(self._kit_offsets)
+
+    def _index_board(self):
+        """Builds the ticket_id and status lookups over self.board. Call after replacing the board."""
+        self._by_id = {c['ticket_id']: c for c in self.board}
+        # status -> {ticket_id: card}: O(1) moves, board order kept within a column
+        self._by_status = defaultdict(dict)
+        for card in self.board:
+            self._by_status[card.setdefault("status", STATUS_QUEUED)][card['ticket_id']] = card
 
     # ==========================================================================
     # 📋 KANBAN OPERATIONS
@@ -124,25 +195,23 @@ class RabbitPrefab:
         """
         Returns the production floor organized by column.
         """
-        columns = {"QUEUED": [], "BUILDING": [], "QC_CHECK": [], "READY": []}
-        for card in self.board:
-            status = card.get("status", "QUEUED")
-            if status in columns:
-                columns[status].append(card)
-        return columns
+        return {k: list(self._by_status[k].values()) for k in BOARD_COLUMNS}
 
     def move_card(self, ticket_id: str, new_status: str, user: str) -> bool:
         """
         Drags a ticket to the next station.
         """
-        card = self._find_card(ticket_id)
+        card = self._by_id.get(ticket_id)
         if not card:
             return False
 
         old_status = card['status']
+        if new_status != old_status:
+            del self._by_status[old_status][ticket_id]
+            self._by_status[new_status][ticket_id] = card
         card['status'] = new_status
 
-        if new_status == "BUILDING":
+        if new_status == STATUS_BUILDING:
             card['assigned_to'] = user
 
         MonkeyHeart.log_system_event("PREFAB_MOVE", f"{ticket_id} moved {old_status} -> {new_status} by {user}")
@@ -157,7 +226,7 @@ class RabbitPrefab:
         Calculates raw materials needed for a production run.
         Foreman orders "50 Kits" -> System orders "50 Boxes, 50 Brackets..."
         """
-        card = self._find_card(ticket_id)
+        card = self._by_id.get(ticket_id)
         if not card: return None
 
         kit_type = card['kit_type']
@@ -168,48 +237,134 @@ class RabbitPrefab:
             Bananas.notify("Recipe Error", f"No BOM found for {kit_type}")
             return None
 
-        shopping_list = []
-        for part in recipe['parts']:
-            total_needed = part['qty'] * run_qty
-            shopping_list.append({
-                "sku": part['sku'],
-                "qty_needed": total_needed,
-                "notes": f"For {run_qty}x {recipe['name']}"
-            })
+        if kit_type in self._nested_kits:
+            # Kit-of-kits: flatten level by level down to raw parts
+            rollup = self._explode_bfs(kit_type, run_qty)
+            skus, totals = rollup.keys(), rollup.values()
+        else:
+            # One multiply over the whole qty column
+            skus = self._bom_skus[kit_type]
+            base_qty = self._bom_qty[kit_type]
+            if np is not None:
+                totals = (base_qty * run_qty).tolist()
+            else:
+                totals = [q * run_qty for q in base_qty]
+
+        # Dicts only at the output edge. A comprehension beats [None] * n plus indexed
+        # stores here: LIST_APPEND is cheaper than STORE_SUBSCR and the growth is amortized.
+        notes = f"For {run_qty}x {recipe['name']}"
+        shopping_list = [
+            {"sku": sku, "qty_needed": total_needed, "notes": notes}
+            for sku, total_needed in zip(skus, totals)
+        ]
 
         MonkeyHeart.log_system_event("PREFAB_BOM", f"Exploded BOM for {ticket_id}: {len(shopping_list)} SKUs needed.")
         return shopping_list
 
+    def _explode_bfs(self, root_kit: str, qty: int) -> Counter:
+        """
+        Breadth-first BOM flatten for nested kits.
+        Each depth merges repeated sub-kits first, so every unique kit is looked up
+        once per level; raw parts accumulate in a Counter (SKU -> total qty).
+        """
+        totals = Counter()
+        frontier = deque([(root_kit, qty)])
+        depth = 0
+
+        while frontier:
+            if depth >= self.MAX_BOM_DEPTH:
+                Bananas.notify("Recipe Error", f"BOM for {root_kit} nests deeper than {self.MAX_BOM_DEPTH} (circular kit?)")
+                break
+
+            runs = defaultdict(int)
+            while frontier:
+                kit, n = frontier.popleft()
+                runs[kit] += n
+
+            for kit, n in runs.items():
+                for sku, base in zip(self._bom_skus[kit], self._bom_qty[kit]):
+                    need = int(base) * n
+                    if sku in self.recipes:
+                        frontier.append((sku, need))
+                    else:
+                        totals[sku] += need
+            depth += 1
+
+        return totals
+
+    def explode_all_queued(self) -> Dict[str, int]:
+        """
+        Procurement rollup: raw parts needed across every QUEUED ticket (SKU -> qty).
+        """
+        cards = [c for c in self._by_status[STATUS_QUEUED].values() if c['kit_type'] in self._bom_flat]
+        if not cards:
+            return {}
+
+        if np is None:
+            totals = Counter()
+            for card in cards:
+                skus, qtys = self._bom_flat[card['kit_type']]
+                for sku, q in zip(skus, qtys):
+                    totals[sku] += q * card['qty']
+            return dict(totals)
+
+        n = len(cards)
+        kit_idx = np.fromiter((self._kit_vocab[c['kit_type']] for c in cards), dtype=np.intp, count=n)
+        run_qty = np.fromiter((c['qty'] for c in cards), dtype=np.int64, count=n)
+
+        # Gather every ticket's CSR rows: row = kit start + position within the kit
+        counts = self._kit_nparts[kit_idx]
+        ticket_start = np.cumsum(counts) - counts
+        rows = (np.arange(counts.sum()) - np.repeat(ticket_start, counts)
+                + np.repeat(self._kit_offsets[kit_idx], counts))
+
+        need = np.repeat(run_qty, counts) * self._parts_qty[rows]
+        totals = np.bincount(self._parts_sku_idx[rows], weights=need, minlength=len(self._sku_names))
+        return {sku: int(t) for sku, t in zip(self._sku_names, totals.tolist()) if t}
+
     # ==========================================================================
     # 🏷️ LABELING (The Passport)
     # ==========================================================================
 
-    def generate_kit_label(self, ticket_id: str) -> Dict[str, str]:
+    def generate_kit_label(self, ticket_id: str, now: Optional[datetime] = None) -> Dict[str, str]:
         """
         Creates the data for the QR Code label printer.
         """
-        card = self._find_card(ticket_id)
+        card = self._by_id.get(ticket_id)
         if not card: return {}
 
-        # Unique Serial for this Batch
-        batch_id = f"{ticket_id}-{int(time.time())}"
+        # Unique Serial for this Batch (serial and print date from one clock read)
+        now = now or datetime.now()
+        label_data = self._build_label(card, int(now.timestamp()), now.strftime("%Y-%m-%d"))
 
-        label_data = {
+        MonkeyHeart.log_system_event("PREFAB_LABEL", f"Generated Label for Batch {label_data['batch_id']}")
+        return label_data
+
+    def generate_kit_labels(self, ticket_ids: List[str], now: Optional[datetime] = None) -> List[Dict[str, str]]:
+        """
+        Print run: one label per ticket, all stamped from a single clock read.
+        Unknown tickets are skipped.
+        """
+        now = now or datetime.now()
+        stamp = int(now.timestamp())
+        date_s = now.strftime("%Y-%m-%d")
+
+        labels = [self._build_label(card, stamp, date_s)
+                  for card in map(self._by_id.get, ticket_ids) if card]
+
+        MonkeyHeart.log_system_event("PREFAB_LABEL", f"Generated {len(labels)} Labels (stamp {stamp})")
+        return labels
+
+    def _build_label(self, card: Dict, stamp: int, date_s: str) -> Dict[str, str]:
+        batch_id = f"{card['ticket_id']}-{stamp}"
+        return {
+            "batch_id": batch_id,
             "qr_content": f"JIS://PREFAB/{batch_id}",
-            "human_readable": f"{card['job_id']}\n{card['kit_type']}\nQTY: {card['qty']}",
-            "date": datetime.now().strftime("%Y-%m-%d"),
+            "human_readable": self.LABEL_TEXT.format_map(card),
+            "date": date_s,
             "qc_by": "PENDING"
         }
 
-        MonkeyHeart.log_system_event("PREFAB_LABEL", f"Generated Label for Batch {batch_id}")
-        return label_data
-
-    def _find_card(self, t_id: str) -> Optional[Dict]:
-        for c in self.board:
-            if c['ticket_id'] == t_id:
-                return c
-        return None
-
 
 # ==============================================================================
 # 🧪 SELF-DIAGNOSTIC (The Friday Test)
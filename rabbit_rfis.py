@@ -23,8 +23,16 @@ INTEGRATIONS:
 """
 
 import time
+from array import array
+from collections import Counter
 from datetime import datetime, timedelta
-from typing import List, Dict, Optional, Any
+from typing import List, Dict, Iterator, Optional, Any
+
+# NumPy is optional: large RFI logs get a vectorized aging check when it is present
+try:
+    import numpy as np
+except ImportError:
+    np = None
 
 # ==============================================================================
 # 🍌 IMPORT BANANAS (The Shield)
@@ -56,6 +64,10 @@ except ImportError:
 # ❓ THE QUESTION QUEUE (Mock Database)
 # ==============================================================================
 
+STATUS_OPEN = "OPEN"
+STATUS_ANSWERED = "ANSWERED"
+STATUS_CLOSED = "CLOSED"
+
 MOCK_RFIS = [
     {
         "id": "RFI-26001-001",
@@ -63,7 +75,7 @@ MOCK_RFIS = [
         "subject": "Beam Conflict in Room 101",
         "question": "HVAC duct blocks cable tray path. Can we lower tray 6 inches?",
         "proposed_solution": "Lower tray to 9ft AFF.",
-        "status": "OPEN",  # OPEN, ANSWERED, CLOSED
+        "status": STATUS_OPEN,  # OPEN, ANSWERED, CLOSED
         "cost_impact": True,
         "date_sent": "2026-01-15",
         "due_date": "2026-01-18"  # Overdue!
@@ -81,39 +93,65 @@ class RabbitRFIs:
     """
 
     def __init__(self):
-        self.rfis = MOCK_RFIS
+        self.rfis = [dict(r) for r in MOCK_RFIS]  # Own records: answers never touch the module mock
+        self.vector_threshold = 512  # Open RFI count where the NumPy mask beats the dict walk
+        self._index_rfis()
+
+    def _index_rfis(self):
+        """Builds per-job counts and the open queue (id -> RFI, send order). Call after replacing self.rfis."""
+        self._by_id = {r['id']: r for r in self.rfis}
+        self._count_by_job = Counter(r['job_id'] for r in self.rfis)
+        self._open_rfis = {r['id']: r for r in self.rfis if r['status'] == STATUS_OPEN}
+        # Columns parallel to self.rfis: due date as YYYYMMDD and an open flag
+        self._row_by_id = {r['id']: i for i, r in enumerate(self.rfis)}
+        self._due_col = array('i', (self._date_int(r['due_date']) for r in self.rfis))
+        self._open_col = array('b', (r['status'] == STATUS_OPEN for r in self.rfis))
+
+    @staticmethod
+    def _date_int(date_str: str) -> int:
+        """'2026-01-18' -> 20260118 (orders the same as the ISO string)."""
+        return int(date_str.replace('-', ''))
 
     # ==========================================================================
     # 📤 DRAFTING
     # ==========================================================================
 
     def create_rfi(self, job_id: str, subject: str, question: str,
-                   impact_cost: bool, impact_schedule: bool) -> Dict[str, Any]:
+                   impact_cost: bool, impact_schedule: bool,
+                   now: Optional[datetime] = None) -> Dict[str, Any]:
         """
         Generates a formal question.
+        `now` lets a bulk caller stamp every RFI from one clock read.
         """
         # Auto-Numbering
-        job_rfis = [r for r in self.rfis if r['job_id'] == job_id]
-        next_num = len(job_rfis) + 1
+        next_num = self._count_by_job[job_id] + 1
         rfi_id = f"RFI-{job_id.replace('JOB-', '')}-{next_num:03d}"
 
         # Calculate Due Date (Standard 3 Days)
-        due_date = (datetime.now() + timedelta(days=3)).strftime("%Y-%m-%d")
+        now = now or datetime.now()
+        date_sent = now.strftime("%Y-%m-%d")
+        due_date = (now + timedelta(days=3)).strftime("%Y-%m-%d")
 
         new_rfi = {
             "id": rfi_id,
             "job_id": job_id,
             "subject": subject,
             "question": question,
-            "status": "OPEN",
+            "status": STATUS_OPEN,
             "cost_impact": impact_cost,
             "schedule_impact": impact_schedule,
-            "date_sent": datetime.now().strftime("%Y-%m-%d"),
+            "date_sent": date_sent,
             "due_date": due_date,
             "answer": None
         }
 
         self.rfis.append(new_rfi)
+        self._by_id[rfi_id] = new_rfi
+        self._count_by_job[job_id] = next_num
+        self._open_rfis[rfi_id] = new_rfi
+        self._row_by_id[rfi_id] = len(self.rfis) - 1
+        self._due_col.append(self._date_int(due_date))
+        self._open_col.append(1)
 
         MonkeyHeart.log_system_event("RFI_SENT", f"{rfi_id}: {subject} (Cost Impact: {impact_cost})")
 
@@ -128,16 +166,19 @@ class RabbitRFIs:
     # 📥 PROCESSING ANSWER
     # ==========================================================================
 
-    def receive_answer(self, rfi_id: str, answer_text: str, answered_by: str):
+    def receive_answer(self, rfi_id: str, answer_text: str, answered_by: str,
+                       now: Optional[datetime] = None):
         """
         Logs the architect's reply.
         """
-        rfi = next((r for r in self.rfis if r['id'] == rfi_id), None)
+        rfi = self._by_id.get(rfi_id)
         if not rfi: return False
+        self._open_rfis.pop(rfi_id, None)
+        self._open_col[self._row_by_id[rfi_id]] = 0
 
         rfi['answer'] = answer_text
-        rfi['status'] = "ANSWERED"
-        rfi['date_answered'] = datetime.now().strftime("%Y-%m-%d")
+        rfi['status'] = STATUS_ANSWERED
+        rfi['date_answered'] = (now or datetime.now()).strftime("%Y-%m-%d")
 
         MonkeyHeart.log_system_event("RFI_ANSWER", f"{rfi_id} answered by {answered_by}")
         Bananas.notify("RFI Answered", f"{rfi_id}: See response.")
@@ -152,18 +193,37 @@ class RabbitRFIs:
         """
         Finds questions that are rotting on the vine.
         """
-        overdue = []
-        now = datetime.now().strftime("%Y-%m-%d")
+        late = self._late_rfis()
+        if late:
+            Bananas.notify("RFI Delay", f"{len(late)} RFIs are late. Send the nag email.")
 
-        for rfi in self.rfis:
-            if rfi['status'] == "OPEN" and now > rfi['due_date']:
-                msg = f"OVERDUE: {rfi['id']} (Due {rfi['due_date']})"
-                overdue.append(msg)
+        return [self._overdue_line(rfi) for rfi in late]
+
+    def count_overdue(self) -> int:
+        """Badge count only - no message strings are built."""
+        return len(self._late_rfis())
+
+    def iter_overdue(self) -> Iterator[str]:
+        """Lazily formats the overdue lines (e.g. when the RFI drawer opens)."""
+        return map(self._overdue_line, self._late_rfis())
+
+    @staticmethod
+    def _overdue_line(rfi: Dict) -> str:
+        return f"OVERDUE: {rfi['id']} (Due {rfi['due_date']})"
+
+    def _late_rfis(self) -> List[Dict]:
+        """Open RFIs past their due date, in send order."""
+        now = datetime.now().strftime("%Y-%m-%d")
 
-        if overdue:
-            Bananas.notify("RFI Delay", f"{len(overdue)} RFIs are late. Send the nag email.")
+        if np is not None and len(self._open_rfis) >= self.vector_threshold:
+            # One comparison over the due/open columns (zero-copy views of the arrays)
+            due = np.frombuffer(self._due_col, dtype=np.intc)
+            is_open = np.frombuffer(self._open_col, dtype=np.int8)
+            rows = np.flatnonzero((due < self._date_int(now)) & (is_open != 0)).tolist()
+            del due, is_open  # Release the buffers so the columns can grow again
+            return [self.rfis[i] for i in rows]
 
-        return overdue
+        return [rfi for rfi in self._open_rfis.values() if now > rfi['due_date']]
 
 
 # ==============================================================================
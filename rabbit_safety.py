@@ -22,8 +22,11 @@ INTEGRATIONS:
 - Raptor Broadcast (Emergency Notifications)
 """
 
+import sys
 import time
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
+from functools import lru_cache
 from typing import List, Dict, Optional, Any
 
 # ==============================================================================
@@ -72,6 +75,38 @@ MOCK_TALKS = [
 ]
 
 
+# Stop-work log + device push run off the caller's thread; one worker keeps them in order.
+# UI toasts stay on the caller's thread (Streamlit only renders from the script thread).
+_STOP_WORK_POOL = ThreadPoolExecutor(max_workers=1, thread_name_prefix="stop-work")
+
+
+def _broadcast_stop_work(job_id: str, msg: str):
+    """
+    Background job: security log and site-wide push for a stop-work order.
+    """
+    MonkeyHeart.log_security_event("STOP_WORK", msg, "EMERGENCY")
+
+    # Mock: Call Raptor Broadcast
+    print(f" >> [BROADCAST] PUSH TO ALL DEVICES ON SITE {job_id}: {msg}")
+
+
+def _report_broadcast_failure(job_id: str, future):
+    """Done-callback: a failed stop-work push must never vanish inside its future."""
+    error = future.exception()
+    if error is None:
+        return
+    try:
+        MonkeyHeart.log_security_event("STOP_WORK_BROADCAST_FAILED", f"{job_id}: {error!r}", "CRITICAL")
+    except Exception:
+        print(f"🛑 STOP WORK BROADCAST FAILED for {job_id}: {error!r}", file=sys.stderr)
+
+
+@lru_cache(maxsize=1024)
+def _iso_second(epoch_s: int) -> str:
+    """Local ISO timestamp for a whole epoch second (incidents in a burst share one)."""
+    return datetime.fromtimestamp(epoch_s).isoformat()
+
+
 # ==============================================================================
 # 🐰 RABBIT SAFETY CLASS
 # ==============================================================================
@@ -82,14 +117,15 @@ class RabbitSafety:
     """
 
     def __init__(self):
-        self.talks = MOCK_TALKS
+        self.talks = list(MOCK_TALKS)  # Own list: new talks never touch the module mock
         self.incidents = []
 
     # ==========================================================================
     # 🗣️ TOOLBOX TALKS
     # ==========================================================================
 
-    def conduct_toolbox_talk(self, job_id: str, topic: str, foreman: str, attendees: List[str]) -> Dict[str, Any]:
+    def conduct_toolbox_talk(self, job_id: str, topic: str, foreman: str, attendees: List[str],
+                             now: Optional[datetime] = None) -> Dict[str, Any]:
         """
         Logs a mandatory safety meeting.
         """
@@ -104,7 +140,7 @@ class RabbitSafety:
             "topic": topic,
             "foreman": foreman,
             "attendees": attendees,
-            "date": datetime.now().strftime("%Y-%m-%d")
+            "date": (now or datetime.now()).strftime("%Y-%m-%d")
         }
 
         self.talks.append(record)
@@ -121,17 +157,11 @@ class RabbitSafety:
         Logs a Bad Day (Injury) or a Good Catch (Near Miss).
         Types: INJURY, PROPERTY_DAMAGE, NEAR_MISS.
         """
-        inc_id = f"INC-{int(time.time())}"
+        # One ns clock read: unique ID + timestamp
+        ts_ns = time.time_ns()
+        inc_id = f"INC-{ts_ns}"
 
-        record = {
-            "id": inc_id,
-            "job_id": job_id,
-            "reporter": reporter,
-            "type": type_code,
-            "description": description,
-            "timestamp": datetime.now().isoformat(),
-            "status": "OPEN"
-        }
+        record = self._incident_record(inc_id, job_id, reporter, type_code, description, ts_ns)
 
         self.incidents.append(record)
 
@@ -146,6 +176,56 @@ class RabbitSafety:
 
         return {"success": True, "incident_id": inc_id}
 
+    def report_incidents(self, reports: List[Dict[str, str]]) -> Dict[str, Any]:
+        """
+        Safety-sweep import: many incidents at once.
+        Each report needs job_id, reporter, type_code, description.
+        Near misses roll up into one toast + one log event; injuries/damage stay one alert each.
+        """
+        ts_ns = time.time_ns()
+
+        records = [
+            self._incident_record(f"INC-{ts_ns}-{i:03d}", r['job_id'], r['reporter'],
+                                  r['type_code'], r['description'], ts_ns)
+            for i, r in enumerate(reports, 1)
+        ]
+        self.incidents.extend(records)
+
+        near_misses = [rec for rec in records if rec['type'] == "NEAR_MISS"]
+        critical = [rec for rec in records if rec['type'] != "NEAR_MISS"]
+
+        if near_misses:
+            reporters = sorted({rec['reporter'] for rec in near_misses})
+            Bananas.notify("Good Catches!", f"{len(near_misses)} hazards reported by {', '.join(reporters)}. Reward Points Issued.")
+            MonkeyHeart.log_system_event("SAFETY_CATCH", "\n".join(
+                f"Near Miss logged by {rec['reporter']}" for rec in near_misses))
+
+        for rec in critical:
+            Bananas.notify("🚨 INCIDENT REPORT 🚨", f"{rec['type']} at {rec['job_id']}: {rec['description']}")
+            MonkeyHeart.log_security_event("SAFETY_INCIDENT", rec['description'], "CRITICAL")
+
+        return {"success": True, "incident_ids": [rec['id'] for rec in records]}
+
+    @staticmethod
+    def incident_time(record: Dict[str, Any]) -> str:
+        """ISO timestamp for display (second resolution)."""
+        return record['timestamp']
+
+    @staticmethod
+    def _incident_record(inc_id: str, job_id: str, reporter: str, type_code: str,
+                         description: str, ts_ns: int) -> Dict[str, Any]:
+        return {
+            "id": inc_id,
+            "job_id": job_id,
+            "reporter": reporter,
+            "type": type_code,
+            "description": description,
+            # ISO string kept for existing readers; a burst shares one cached format
+            "timestamp": _iso_second(ts_ns // 1_000_000_000),
+            "ts_ns": ts_ns,
+            "status": "OPEN"
+        }
+
     # ==========================================================================
     # 🛑 STOP WORK AUTHORITY
     # ==========================================================================
@@ -153,15 +233,16 @@ class RabbitSafety:
     def trigger_stop_work(self, job_id: str, user: str, reason: str):
         """
         The Nuclear Safety Option.
+        The banner shows immediately; the log + device push go out on the stop-work worker.
         """
         msg = f"STOP WORK TRIGGERED BY {user} AT {job_id}. REASON: {reason}"
 
-        # 1. Notify Everyone
+        # 1. Notify Everyone (caller's thread, so the banner renders)
         Bananas.notify("🛑 STOP WORK ORDER 🛑", msg)
-        MonkeyHeart.log_security_event("STOP_WORK", msg, "EMERGENCY")
 
-        # 2. Mock: Call Raptor Broadcast
-        print(f" >> [BROADCAST] PUSH TO ALL DEVICES ON SITE {job_id}: {msg}")
+        # 2. Log + broadcast without blocking the caller
+        future = _STOP_WORK_POOL.submit(_broadcast_stop_work, job_id, msg)
+        future.add_done_callback(lambda f: _report_broadcast_failure(job_id, f))
 
         return {"status": "HALTED", "time": datetime.now().strftime("%H:%M")}
 
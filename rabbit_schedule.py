@@ -24,7 +24,8 @@ INTEGRATIONS:
 """
 
 import time
-from datetime import datetime, timedelta
+from collections import defaultdict
+from datetime import date, timedelta
 from typing import List, Dict, Optional, Any
 
 # ==============================================================================
@@ -74,6 +75,21 @@ MOCK_SCHEDULE = [
     }
 ]
 
+# Recurring Outlook blocks (Mock Raptor Outlook feed), keyed by weekday on sync
+MOCK_OOO_RULES = [
+    {"user_id": "U-003", "user_name": "Billy", "weekday": "Wednesday", "reason": "Doctor's Appt"}
+]
+
+_WEEKDAYS = ("Monday", "Tuesday", "Wednesday", "Thursday", "Friday", "Saturday", "Sunday")
+
+
+def _weekday(date_str: str) -> Optional[int]:
+    """'2026-01-21' -> 2 (Wednesday), or None for a malformed date."""
+    try:
+        return date.fromisoformat(date_str).weekday()
+    except (TypeError, ValueError):
+        return None
+
 
 # ==============================================================================
 # 🐰 RABBIT SCHEDULE CLASS
@@ -85,31 +101,42 @@ class RabbitSchedule:
     """
 
     def __init__(self):
-        self.board = MOCK_SCHEDULE
+        self.board = list(MOCK_SCHEDULE)  # Own list: new shifts never touch the module mock
         # Simulation of Total Headcount
         self.total_staff = 10
+        self._index_board()
+        # (user_id, weekday) -> OOO reason; holds for every date, past or future
+        self._ooo = {}
+        self.sync_outlook(MOCK_OOO_RULES)
 
         # ==========================================================================
 
     # ♟️ ASSIGNMENT LOGIC
     # ==========================================================================
 
+    def _index_board(self):
+        """Builds the (user, date) booking set and per-date roster. Call after replacing the board."""
+        self._booked = {(s['user_id'], s['date']) for s in self.board}
+        self._by_date = defaultdict(list)
+        for s in self.board:
+            self._by_date[s['date']].append(s)
+
     def assign_shift(self, user_id: str, user_name: str, job_id: str, date_str: str) -> Dict[str, Any]:
         """
         Tries to put a person on a job.
         Checks for conflicts first.
         """
         # 1. Check Double Booking (Internal)
-        for shift in self.board:
-            if shift['user_id'] == user_id and shift['date'] == date_str:
-                Bananas.notify("Scheduling Conflict", f"{user_name} is already on {shift['job_id']} that day.")
-                return {"success": False, "reason": "DOUBLE_BOOKED"}
+        if (user_id, date_str) in self._booked:
+            # Only that day's roster is searched, for the conflicting job
+            job = next((s['job_id'] for s in self._by_date[date_str] if s['user_id'] == user_id), "another job")
+            Bananas.notify("Scheduling Conflict", f"{user_name} is already on {job} that day.")
+            return {"success": False, "reason": "DOUBLE_BOOKED"}
 
         # 2. Check Outlook (External - Vacation/Appointments)
-        # We assume raptor_outlook is imported or mocked here.
-        # For V7.0, we simulate a simple check.
-        if "Billy" in user_name and "Wednesday" in self._get_day_name(date_str):
-            Bananas.notify("Outlook Conflict", f"{user_name} is OOO (Doctor's Appt).")
+        ooo_reason = self._ooo.get((user_id, _weekday(date_str)))
+        if ooo_reason:
+            Bananas.notify("Outlook Conflict", f"{user_name} is OOO ({ooo_reason}).")
             return {"success": False, "reason": "OUTLOOK_OOO"}
 
         # 3. Create Assignment
@@ -122,11 +149,21 @@ class RabbitSchedule:
             "shift": "DAY"
         }
         self.board.append(new_shift)
+        self._booked.add((user_id, date_str))
+        self._by_date[date_str].append(new_shift)
 
         MonkeyHeart.log_system_event("SCHED_ASSIGN", f"Assigned {user_name} to {job_id} on {date_str}")
 
         return {"success": True, "shift_id": new_shift['id']}
 
+    def sync_outlook(self, rules: List[Dict[str, str]]):
+        """
+        Loads recurring OOO blocks ("Billy, Wednesdays") as (user_id, weekday) entries,
+        so a lookup is one dict probe for any date with no window to expand.
+        """
+        for rule in rules:
+            self._ooo[(rule['user_id'], _WEEKDAYS.index(rule['weekday']))] = rule['reason']
+
     # ==========================================================================
     # 📊 CAPACITY PLANNING
     # ==========================================================================
@@ -135,33 +172,50 @@ class RabbitSchedule:
         """
         Returns stats for the day: Who is working, who is on the bench.
         """
-        working = [s for s in self.board if s['date'] == date_str]
+        working = list(self._by_date.get(date_str, ()))
         count_working = len(working)
         count_bench = self.total_staff - count_working
         utilization = (count_working / self.total_staff) * 100
 
-        status = "OPTIMAL"
-        if utilization > 100:
-            status = "OVERBOOKED"
-        elif utilization < 60:
-            status = "UNDERUTILIZED"
-
         return {
             "date": date_str,
             "total_staff": self.total_staff,
             "working": count_working,
             "bench": count_bench,
             "utilization_pct": round(utilization, 1),
-            "status": status,
+            "status": self._capacity_status(utilization),
             "roster": working
         }
 
-    def _get_day_name(self, date_str: str) -> str:
-        try:
-            dt = datetime.strptime(date_str, "%Y-%m-%d")
-            return dt.strftime("%A")
-        except:
-            return ""
+    def get_capacity_range(self, start_str: str, end_str: str) -> Dict[str, Any]:
+        """
+        Capacity for every day from start to end (inclusive) in one call - the 2-week planner view.
+        Returns parallel columns (one entry per date) instead of one dict per day.
+        """
+        start = date.fromisoformat(start_str)
+        n_days = (date.fromisoformat(end_str) - start).days + 1
+        dates = [(start + timedelta(days=i)).isoformat() for i in range(max(n_days, 0))]
+
+        working = [len(self._by_date.get(d, ())) for d in dates]
+        pct_per_head = 100.0 / self.total_staff
+        utilization = [n * pct_per_head for n in working]
+
+        return {
+            "dates": dates,
+            "total_staff": self.total_staff,
+            "working": working,
+            "bench": [self.total_staff - n for n in working],
+            "utilization_pct": [round(u, 1) for u in utilization],
+            "status": [self._capacity_status(u) for u in utilization]
+        }
+
+    @staticmethod
+    def _capacity_status(utilization: float) -> str:
+        if utilization > 100:
+            return "OVERBOOKED"
+        if utilization < 60:
+            return "UNDERUTILIZED"
+        return "OPTIMAL"
 
 
 # ==============================================================================
@@ -185,7 +239,7 @@ if __name__ == "__main__":
 
     # 4. Test Outlook Conflict (Billy)
     print("\n[TEST 3] Assigning Billy on Wednesday (Doctor)...")
-    # Note: Our mock logic in _get_day_name handles the date check
+    # Note: MOCK_OOO_RULES blocks Billy (U-003) every Wednesday
     res3 = dispatch.assign_shift("U-003", "Billy", "JOB-26001", "2026-01-21")
     print(f" > Status: {res3['success']} (Reason: {res3.get('reason')})")
 
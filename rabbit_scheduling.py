@@ -1,4 +1,5 @@
 import pandas as pd
+from collections import defaultdict, deque
 from datetime import datetime, timedelta
 from monkey_brain import MonkeyBrain
 from monkey_heart import MonkeyHeart
@@ -12,31 +13,36 @@ class RabbitScheduling:
     Target: Eliminating job-site "Dead Time" through synchronized scheduling.
     """
 
+    INSERT_TASK_SQL = """
+        INSERT INTO schedule_tasks (project_id, task_name, start_date, end_date, dependency_id)
+        VALUES (?, ?, ?, ?, ?)
+    """
+
     @staticmethod
     def initialize_schedule_tables():
         """
         OXIDE: Dissects the database to support task dependencies and milestones.
         """
-        conn = MonkeyBrain.get_connection()
+        conn = MonkeyBrain.get_cached_connection()
         if not conn: return
 
         try:
-            cursor = conn.cursor()
-            # SCHEDULE_TASKS: The timeline nodes
-            cursor.execute("""
-                CREATE TABLE IF NOT EXISTS schedule_tasks (
-                    task_id INTEGER PRIMARY KEY AUTOINCREMENT,
-                    project_id TEXT,
-                    task_name TEXT,
-                    start_date DATE,
-                    end_date DATE,
-                    assigned_crew TEXT,
-                    dependency_id INTEGER, -- Link to a task that must finish first
-                    FOREIGN KEY(project_id) REFERENCES core_projects(project_id)
-                )
-            """)
-            conn.commit()
-            conn.close()
+            with conn:
+                cursor = conn.cursor()
+                # SCHEDULE_TASKS: The timeline nodes
+                cursor.execute("""
+                    CREATE TABLE IF NOT EXISTS schedule_tasks (
+                        task_id INTEGER PRIMARY KEY AUTOINCREMENT,
+                        project_id TEXT,
+                        task_name TEXT,
+                        start_date DATE,
+                        end_date DATE,
+                        assigned_crew TEXT,
+                        dependency_id INTEGER, -- Link to a task that must finish first
+                        FOREIGN KEY(project_id) REFERENCES core_projects(project_id)
+                    )
+                """)
+            MonkeyHeart.log_system_event("DB_TUNED", "Schedule tables on journal_mode=%s", MonkeyBrain.journal_mode())
         except Exception as e:
             Bananas.report_collision(e, "SCHEDULING_SCHEMA_CRASH")
 
@@ -45,15 +51,32 @@ class RabbitScheduling:
         """
         OXIDE: Injects a new node into the project timeline.
         """
+        return RabbitScheduling.add_milestones_bulk(project_id, [(name, start, duration_days, depends_on)])
+
+    @staticmethod
+    def add_milestones_bulk(project_id, rows):
+        """
+        OXIDE: Timeline population. Each row is (name, start 'YYYY-MM-DD', duration_days, depends_on).
+        Every node lands in one transaction (one commit/fsync for the whole load).
+        """
+        if not rows: return True
+
+        conn = MonkeyBrain.get_cached_connection()
+        if not conn: return False
+
         try:
-            start_dt = datetime.strptime(start, '%Y-%m-%d')
-            end_dt = start_dt + timedelta(days=duration_days)
+            params = []
+            for name, start, duration_days, depends_on in rows:
+                start_d = datetime.strptime(start, '%Y-%m-%d').date()
+                params.append((project_id, name, start_d, start_d + timedelta(days=duration_days), depends_on))
 
-            cmd = """
-                INSERT INTO schedule_tasks (project_id, task_name, start_date, end_date, dependency_id)
-                VALUES (?, ?, ?, ?, ?)
-            """
-            MonkeyBrain.execute_oxide(cmd, (project_id, name, start_dt.date(), end_dt.date(), depends_on))
+            conn.execute("BEGIN IMMEDIATE")
+            try:
+                conn.executemany(RabbitScheduling.INSERT_TASK_SQL, params)
+                conn.commit()
+            except Exception:
+                conn.rollback()
+                raise
 
             return True
         except Exception as e:
@@ -67,12 +90,74 @@ class RabbitScheduling:
         Essential for the 'Executive Buy-In' of project timelines.
         """
         query = "SELECT task_name as Task, start_date as Start, end_date as Finish, assigned_crew as Resource FROM schedule_tasks WHERE project_id = ? ORDER BY start_date"
-        return MonkeyBrain.query_oxide(query, (project_id,))
+        df = MonkeyBrain.query_oxide(query, (project_id,))
+        if df is None: return df
+
+        # Ship typed datetime64 columns so the Gantt renderer never re-parses strings
+        df['Start'] = pd.to_datetime(df['Start'], format='%Y-%m-%d')
+        df['Finish'] = pd.to_datetime(df['Finish'], format='%Y-%m-%d')
+        df.attrs['project_id'] = project_id
+        return df
 
     @staticmethod
     def calculate_labor_burn(project_id):
         """
         OXIDE: Analyzes the schedule to predict weekly manpower requirements.
+        First cut is the Critical Path (CPM): topological order (Kahn) with one forward
+        pass for earliest start and one backward pass for slack - O(tasks + links).
+        Day offsets are from project start; critical tasks have zero slack.
         """
-        # This will blow up into a 1,500 line algorithm in the 50k version.
-        pass
\ No newline at end of file
+        conn = MonkeyBrain.get_cached_connection()
+        if not conn: return None
+
+        try:
+            rows = conn.execute(
+                "SELECT task_id, dependency_id, julianday(end_date) - julianday(start_date) "
+                "FROM schedule_tasks WHERE project_id = ?", (project_id,)
+            ).fetchall()
+        except Exception as e:
+            Bananas.report_collision(e, "CPM_DISSECTION_FAILURE")
+            return None
+
+        dur = {task_id: days or 0.0 for task_id, _dep, days in rows}
+        successors = defaultdict(list)
+        in_degree = dict.fromkeys(dur, 0)
+        for task_id, dep, _days in rows:
+            if dep in dur:  # Links to other projects / deleted tasks don't constrain this timeline
+                successors[dep].append(task_id)
+                in_degree[task_id] += 1
+
+        # Forward pass in topological order
+        earliest = dict.fromkeys(dur, 0.0)
+        order = []
+        ready = deque(t for t, n in in_degree.items() if n == 0)
+        while ready:
+            u = ready.popleft()
+            order.append(u)
+            finish = earliest[u] + dur[u]
+            for v in successors[u]:
+                if finish > earliest[v]:
+                    earliest[v] = finish
+                in_degree[v] -= 1
+                if in_degree[v] == 0:
+                    ready.append(v)
+
+        if len(order) < len(dur):
+            Bananas.notify("SCHEDULE_LOOP", f"{project_id}: circular task dependencies; CPM skipped")
+            return None
+
+        # Backward pass in reverse order
+        project_end = max((earliest[t] + dur[t] for t in order), default=0.0)
+        latest = {}
+        for u in reversed(order):
+            latest_finish = min((latest[v] for v in successors[u]), default=project_end)
+            latest[u] = latest_finish - dur[u]
+
+        return pd.DataFrame({
+            "task_id": order,
+            "duration": [dur[t] for t in order],
+            "earliest_start": [earliest[t] for t in order],
+            "latest_start": [latest[t] for t in order],
+            "slack": [latest[t] - earliest[t] for t in order],
+            "critical": [latest[t] == earliest[t] for t in order],
+        })
\ No newline at end of file
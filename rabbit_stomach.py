@@ -26,6 +26,12 @@ import time
 from datetime import datetime, timedelta
 from typing import List, Dict, Optional, Any
 
+# NumPy is optional: the pantry audit runs as column masks when it is present
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
 # ==============================================================================
 # 🍌 IMPORT BANANAS (The Shield)
 # ==============================================================================
@@ -91,7 +97,14 @@ class RabbitStomach:
     """
 
     def __init__(self):
-        self.stock = MOCK_INVENTORY
+        # Own copy (batches included): the snapshot's dirty flag and the FIFO cursors
+        # only track writes made through this instance
+        self.stock = {sku: {**data, "batches": [dict(b) for b in data['batches']]}
+                      for sku, data in MOCK_INVENTORY.items()}
+        # Audit columns (see _refresh_arrays); rebuilt lazily after any stock write
+        self._arrays_dirty = True
+        # SKU -> index of its oldest batch that may still hold stock (FIFO cursor)
+        self._fifo_head = {}
 
     # ==========================================================================
     # 📥 CONSUMPTION (Check In/Out)
@@ -116,6 +129,7 @@ class RabbitStomach:
                 "date_in": datetime.now().strftime("%Y-%m-%d"),
                 "cost": 0.0  # Logic to pull from PO would go here
             })
+            self._arrays_dirty = True
             MonkeyHeart.log_system_event("INV_RECEIVE", f"Received {qty} of {sku}. New Total: {item['qoh']}")
             return {"success": True, "new_total": item['qoh']}
 
@@ -126,7 +140,8 @@ class RabbitStomach:
                 return {"success": False}
 
             item['qoh'] -= qty
-            self._consume_batches(item, qty)
+            self._consume_batches(sku, item, qty)
+            self._arrays_dirty = True
 
             MonkeyHeart.log_system_event("INV_TRANSFER", f"Sent {qty} of {sku} to {job_id}.")
 
@@ -136,19 +151,23 @@ class RabbitStomach:
 
             return {"success": True, "remaining": item['qoh']}
 
-    def _consume_batches(self, item: Dict, qty_needed: int):
+    def _consume_batches(self, sku: str, item: Dict, qty_needed: int):
         """
         FIFO Logic: Eat the oldest food first.
+        Starts at the SKU's FIFO cursor, so batches emptied by earlier transfers are never rescanned.
         """
+        batches = item['batches']
+        head = self._fifo_head.get(sku, 0)
         remaining_need = qty_needed
         # Iterate through batches (oldest first)
-        for batch in item['batches']:
-            if remaining_need <= 0: break
-
-            if batch['qty'] > 0:
-                take = min(batch['qty'], remaining_need)
-                batch['qty'] -= take
-                remaining_need -= take
+        while remaining_need > 0 and head < len(batches):
+            batch = batches[head]
+            take = min(batch['qty'], remaining_need)
+            batch['qty'] -= take
+            remaining_need -= take
+            if batch['qty'] <= 0:
+                head += 1
+        self._fifo_head[sku] = head
 
     # ==========================================================================
     # 🥗 NUTRITION CHECK (Audit)
@@ -158,7 +177,11 @@ class RabbitStomach:
         """
         Scans for Low Stock and Expired Items.
         """
+        if np is not None:
+            return self._check_pantry_health_vectorized()
+
         issues = []
+        now = datetime.now()
 
         for sku, data in self.stock.items():
             # 1. Hunger Check
@@ -168,13 +191,61 @@ class RabbitStomach:
             # 2. Expiration Check (Mock: Old Caulk)
             if "CAULK" in sku:
                 for batch in data['batches']:
+                    if batch['qty'] <= 0: continue
                     # If batch is older than 1 year
                     in_date = datetime.strptime(batch['date_in'], "%Y-%m-%d")
-                    if (datetime.now() - in_date).days > 365 and batch['qty'] > 0:
+                    if (now - in_date).days > 365:
                         issues.append(f"EXPIRED: {data['name']} (Batch from {batch['date_in']})")
 
         return issues
 
+    def _refresh_arrays(self):
+        """
+        SoA snapshot of self.stock for the audit: per-SKU qoh/min columns plus one
+        flat row per batch (owning SKU index, qty, date_in as datetime64[D]).
+        The dicts stay the source of truth; writes just mark the snapshot dirty.
+        """
+        skus = list(self.stock)
+        items = list(self.stock.values())
+        n = len(items)
+
+        self._skus = skus
+        self._qoh = np.fromiter((d['qoh'] for d in items), dtype=np.int64, count=n)
+        self._min = np.fromiter((d['min_level'] for d in items), dtype=np.int64, count=n)
+        self._perishable = np.fromiter(("CAULK" in sku for sku in skus), dtype=bool, count=n)
+
+        batch_rows = [(i, b) for i, d in enumerate(items) for b in d['batches']]
+        self._batch_sku = np.fromiter((i for i, _ in batch_rows), dtype=np.intp, count=len(batch_rows))
+        self._batch_qty = np.fromiter((b['qty'] for _, b in batch_rows), dtype=np.int64, count=len(batch_rows))
+        self._batch_date = np.array([b['date_in'] for _, b in batch_rows], dtype='datetime64[D]')
+        self._batch_date_str = [b['date_in'] for _, b in batch_rows]
+
+        self._arrays_dirty = False
+
+    def _check_pantry_health_vectorized(self) -> List[str]:
+        if self._arrays_dirty:
+            self._refresh_arrays()
+
+        today = np.datetime64(datetime.now().date(), 'D')
+        low = self._qoh < self._min
+        expired = ((self._batch_qty > 0) & self._perishable[self._batch_sku]
+                   & ((today - self._batch_date) > np.timedelta64(365, 'D')))
+
+        # Strings only for flagged rows, in stock order (low stock first, then that SKU's batches)
+        expired_by_sku = {}
+        for row in np.flatnonzero(expired).tolist():
+            expired_by_sku.setdefault(int(self._batch_sku[row]), []).append(row)
+
+        issues = []
+        for i in sorted(set(np.flatnonzero(low).tolist()) | expired_by_sku.keys()):
+            data = self.stock[self._skus[i]]
+            if low[i]:
+                issues.append(f"LOW STOCK: {data['name']} ({data['qoh']} < {data['min_level']})")
+            for row in expired_by_sku.get(i, ()):
+                issues.append(f"EXPIRED: {data['name']} (Batch from {self._batch_date_str[row]})")
+
+        return issues
+
 
 # ==============================================================================
 # 🧪 SELF-DIAGNOSTIC (The Friday Test)
@@ -16,37 +16,37 @@ class RabbitSubcontractor:
         """
         OXIDE: Dissects the database to support external contract tracking.
         """
-        conn = MonkeyBrain.get_connection()
+        conn = MonkeyBrain.get_cached_connection()
         if not conn: return
 
         try:
-            cursor = conn.cursor()
-            # SUBCONTRACTOR_DIRECTORY: Master list of external firms
-            cursor.execute("""
-                CREATE TABLE IF NOT EXISTS subcontractor_directory (
-                    sub_id TEXT PRIMARY KEY,
-                    company_name TEXT,
-                    contact_person TEXT,
-                    trade_specialty TEXT,
-                    coi_expiry DATE,
-                    status TEXT DEFAULT 'QUALIFIED' -- QUALIFIED, PENDING_COI, BLACKLISTED
-                )
-            """)
+            with conn:
+                cursor = conn.cursor()
+                # SUBCONTRACTOR_DIRECTORY: Master list of external firms
+                cursor.execute("""
+                    CREATE TABLE IF NOT EXISTS subcontractor_directory (
+                        sub_id TEXT PRIMARY KEY,
+                        company_name TEXT,
+                        contact_person TEXT,
+                        trade_specialty TEXT,
+                        coi_expiry DATE,
+                        status TEXT DEFAULT 'QUALIFIED' -- QUALIFIED, PENDING_COI, BLACKLISTED
+                    )
+                """)
 
-            # SUB_CONTRACTS: Specific agreements tied to projects
-            cursor.execute("""
-                CREATE TABLE IF NOT EXISTS sub_contracts (
-                    contract_id TEXT PRIMARY KEY,
-                    project_id TEXT,
-                    sub_id TEXT,
-                    contract_amount REAL,
-                    billed_to_date REAL DEFAULT 0.0,
-                    FOREIGN KEY(project_id) REFERENCES core_projects(project_id),
-                    FOREIGN KEY(sub_id) REFERENCES subcontractor_directory(sub_id)
-                )
-            """)
-            conn.commit()
-            conn.close()
+                # SUB_CONTRACTS: Specific agreements tied to projects
+                cursor.execute("""
+                    CREATE TABLE IF NOT EXISTS sub_contracts (
+                        contract_id TEXT PRIMARY KEY,
+                        project_id TEXT,
+                        sub_id TEXT,
+                        contract_amount REAL,
+                        billed_to_date REAL DEFAULT 0.0,
+                        FOREIGN KEY(project_id) REFERENCES core_projects(project_id),
+                        FOREIGN KEY(sub_id) REFERENCES subcontractor_directory(sub_id)
+                    )
+                """)
+            MonkeyHeart.log_system_event("DB_TUNED", "Subcontractor tables on journal_mode=%s", MonkeyBrain.journal_mode())
         except Exception as e:
             Bananas.report_collision(e, "SUBCONTRACTOR_SCHEMA_CRASH")
 
@@ -61,12 +61,55 @@ class RabbitSubcontractor:
                 INSERT INTO subcontractor_directory (sub_id, company_name, trade_specialty, coi_expiry)
                 VALUES (?, ?, ?, ?)
             """
-            MonkeyBrain.execute_oxide(cmd, (sub_id, name, specialty, coi_date))
+            conn = MonkeyBrain.get_cached_connection()
+            with conn:
+                conn.execute(cmd, (sub_id, name, specialty, coi_date))
             return sub_id
         except Exception as e:
             Bananas.report_collision(e, "SUB_REGISTRATION_FAILURE")
             return None
 
+    @staticmethod
+    def register_subs_bulk(rows):
+        """
+        OXIDE: CSV onboarding. Each row is (name, specialty, coi_date).
+        One transaction for the whole file. IDs end in a per-day sequence number read
+        under the write lock, so imports never reuse an ID (even across calls or
+        prefixes). Returns the inserted IDs, or None if the import was rolled back.
+        """
+        if not rows: return []
+
+        conn = MonkeyBrain.get_cached_connection()
+        if not conn: return None
+
+        today_str = datetime.now().strftime('%y%m%d')
+
+        try:
+            cmd = """
+                INSERT INTO subcontractor_directory (sub_id, company_name, trade_specialty, coi_expiry)
+                VALUES (?, ?, ?, ?)
+            """
+            conn.execute("BEGIN IMMEDIATE")
+            try:
+                # Highest bulk sequence issued today (IDs look like SUB-ACM-260116-7)
+                taken = conn.execute(
+                    "SELECT sub_id FROM subcontractor_directory WHERE sub_id LIKE ?", (f"SUB-%-{today_str}-%",)
+                ).fetchall()
+                seq = max((int(r[0].rsplit('-', 1)[1]) for r in taken if r[0].rsplit('-', 1)[1].isdigit()), default=0)
+
+                params = [(f"SUB-{name[:3].upper()}-{today_str}-{i}", name, specialty, coi_date)
+                          for i, (name, specialty, coi_date) in enumerate(rows, seq + 1)]
+                conn.executemany(cmd, params)
+                conn.commit()
+            except Exception:
+                conn.rollback()
+                raise
+
+            return [p[0] for p in params]
+        except Exception as e:
+            Bananas.report_collision(e, "SUB_REGISTRATION_FAILURE")
+            return None
+
     @staticmethod
     def check_sub_compliance(sub_id):
         """
@@ -74,12 +117,13 @@ class RabbitSubcontractor:
         Triggers the 'Ears' (Block 09) if the sub is working without a COI.
         """
         query = "SELECT company_name, coi_expiry FROM subcontractor_directory WHERE sub_id = ?"
-        df = MonkeyBrain.query_oxide(query, (sub_id,))
+        row = MonkeyBrain.query_scalar(query, (sub_id,))
 
-        if not df.empty:
-            expiry = datetime.strptime(df['coi_expiry'].iloc[0], '%Y-%m-%d').date()
+        if row:
+            company_name, coi_expiry = row
+            expiry = datetime.strptime(coi_expiry, '%Y-%m-%d').date()
             if expiry < datetime.now().date():
-                Bananas.notify("COMPLIANCE_ALARM", f"Subcontractor {df['company_name'].iloc[0]} has EXPIRED COI.")
+                Bananas.notify("COMPLIANCE_ALARM", f"Subcontractor {company_name} has EXPIRED COI.")
                 return False
         return True
 
@@ -81,6 +81,7 @@ class RabbitSubmittals:
 
     def __init__(self):
         self.log = MOCK_LOG
+        self._by_id = {e['id']: e for e in self.log}  # Same dicts as self.log rows
 
     # ==========================================================================
     # 📤 CREATION & SUBMISSION
@@ -114,6 +115,7 @@ class RabbitSubmittals:
         }
 
         self.log.append(entry)
+        self._by_id[sub_id] = entry
         MonkeyHeart.log_system_event("SUB_CREATE", f"Created {sub_id}: {desc}")
 
         return {"success": True, "sub_id": sub_id, "critical": is_critical}
@@ -122,7 +124,7 @@ class RabbitSubmittals:
         """
         Sends the package out.
         """
-        item = next((s for s in self.log if s['id'] == sub_id), None)
+        item = self._by_id.get(sub_id)
         if not item: return False
 
         item['status'] = "SUBMITTED"
@@ -140,7 +142,7 @@ class RabbitSubmittals:
         Processes the returned paperwork.
         Codes: NET (No Exceptions Taken), MCN (Make Corrections Noted), RR (Revise Resubmit), REJ (Rejected).
         """
-        item = next((s for s in self.log if s['id'] == sub_id), None)
+        item = self._by_id.get(sub_id)
         if not item: return False
 
         is_good = status_code in ["NET", "MCN"]
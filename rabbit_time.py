@@ -81,6 +81,11 @@ class RabbitTime:
     def __init__(self):
         self.sheets = MOCK_TIMESHEETS
         self.active_clocks = {}  # {user_id: start_time}
+        # Running weekly hours per user: summed once here, bumped on every clock-out
+        self._weekly_totals = {}
+        for sheet in self.sheets:
+            self._weekly_totals[sheet['user']] = (self._weekly_totals.get(sheet['user'], 0)
+                                                  + sum(e['hours'] for e in sheet['entries']))
 
     # ==========================================================================
     # 📍 GEO-CLOCKING
@@ -129,8 +134,9 @@ class RabbitTime:
         # Clean up
         del self.active_clocks[user_id]
 
-        # Trigger OT Check
+        # Trigger OT Check, then bank the hours
         self._check_overtime_risk(user_id, duration)
+        self._weekly_totals[user_id] = self._weekly_totals.get(user_id, 0) + duration
 
         return {"success": True, "hours": duration}
 
@@ -142,14 +148,7 @@ class RabbitTime:
         """
         Calculates total weekly hours. If > 40, screams.
         """
-        # Mock summing logic
-        current_total = 0
-        user_sheet = next((s for s in self.sheets if s['user'] == user_id), None)
-
-        if user_sheet:
-            current_total = sum(e['hours'] for e in user_sheet['entries'])
-
-        total = current_total + new_hours
+        total = self._weekly_totals.get(user_id, 0) + new_hours
 
         if total > 40:
             Bananas.notify("OVERTIME ALERT", f"{user_id} has hit {total} hours this week!")